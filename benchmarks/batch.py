@@ -0,0 +1,33 @@
+"""
+Batch benchmark: load_many/dump_many against per-record load/dump.
+
+Run from the repository root:
+    python -m benchmarks.batch
+"""
+import random
+import timeit
+
+from benchmarks.schemas import Record, make_record_json
+
+COUNT = 2000
+NUMBER = 5
+
+
+def main():
+    rng = random.Random(1)
+    records = [make_record_json(i, rng) for i in range(1, COUNT + 1)]
+    objs = Record.load_many(records)
+    cases = [
+        ('[load(d) for d]', lambda: [Record.load(d) for d in records]),
+        ('load_many', lambda: Record.load_many(records)),
+        ('[dump(o) for o]', lambda: [o.dump() for o in objs]),
+        ('dump_many', lambda: Record.dump_many(objs)),
+    ]
+    print(f'{COUNT} records')
+    for name, fn in cases:
+        t = min(timeit.repeat(fn, number=NUMBER, repeat=3))
+        print(f'{name:18} {t / NUMBER * 1e3:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
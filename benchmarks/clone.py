@@ -0,0 +1,30 @@
+"""
+Clone benchmark: clone() against load(dump()) and copy.deepcopy.
+
+Run from the repository root:
+    python -m benchmarks.clone
+"""
+import copy
+import random
+import timeit
+
+from benchmarks.schemas import Record, make_record_json
+
+NUMBER = 5000
+
+
+def main():
+    obj = Record.load(make_record_json(1, random.Random(1)))
+    cases = [
+        ('load(dump())', lambda: Record.load(obj.dump())),
+        ('copy.deepcopy', lambda: copy.deepcopy(obj)),
+        ('clone()', lambda: obj.clone()),
+        ('clone(deep=False)', lambda: obj.clone(deep=False)),
+    ]
+    for name, fn in cases:
+        t = min(timeit.repeat(fn, number=NUMBER, repeat=3))
+        print(f'{name:18} {t / NUMBER * 1e6:8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Compressed NDJSON benchmark: decompression and compression in a background thread
+against doing them inline with load/dump.
+
+Run from the repository root:
+    python -m benchmarks.compression
+"""
+import json
+import os
+import random
+import tempfile
+import time
+
+from jsonier.util.compression import open_lines, open_writer
+from benchmarks.schemas import Record, make_record_json
+
+COUNT = 5000
+
+
+def read(path, background):
+    with open_lines(path, background=background) as lines:
+        return sum(1 for line in lines if line and Record.load(json.loads(line)))
+
+
+def write(objs, path, background):
+    with open_writer(path, background=background) as w:
+        for obj in objs:
+            w.write((json.dumps(obj.dump()) + '\n').encode('utf-8'))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(1)
+    objs = [Record.load(make_record_json(i, rng)) for i in range(1, COUNT + 1)]
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f'{COUNT} records')
+        for ext in ('.gz', '.bz2', '.xz'):
+            path = os.path.join(tmp, 'records.ndjson' + ext)
+            w_inline = min(timed(write, objs, path, False) for _ in range(3))
+            w_background = min(timed(write, objs, path, True) for _ in range(3))
+            r_inline = min(timed(read, path, False) for _ in range(3))
+            r_background = min(timed(read, path, True) for _ in range(3))
+            print(f'{ext:4} dump: inline {w_inline:6.2f} s, background {w_background:6.2f} s | '
+                  f'load: inline {r_inline:6.2f} s, background {r_background:6.2f} s')
+
+
+if __name__ == '__main__':
+    main()
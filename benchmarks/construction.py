@@ -0,0 +1,48 @@
+"""
+Construction benchmark: cls(), cls(**kwargs) and load for a wide class.
+
+Run from the repository root:
+    python -m benchmarks.construction
+"""
+import timeit
+
+from jsonier import jsonified, Field, ListOf, MapOf
+
+WIDTH = 60
+NUMBER = 20000
+
+
+def make_wide_class(width: int):
+    attrs = {}
+    for i in range(width):
+        kind = i % 4
+        if kind == 0:
+            attrs[f'f{i}'] = Field(int)
+        elif kind == 1:
+            attrs[f'f{i}'] = Field(str, name=f'field-{i}')
+        elif kind == 2:
+            attrs[f'f{i}'] = Field(ListOf[int], default=[1, 2])
+        else:
+            attrs[f'f{i}'] = Field(MapOf[str])
+    return jsonified(type(f'Wide{width}', (), attrs))
+
+
+def main():
+    cls = make_wide_class(WIDTH)
+    full = cls(**{f'f{i}': v for i, v in enumerate([1, 'x', [1], {'a': 'b'}] * (WIDTH // 4))}).dump()
+    sparse = {k: v for k, v in list(full.items())[:WIDTH // 6]}
+    kwargs = {f'f{i}': i for i in range(0, WIDTH, 4)}
+    cases = [
+        ('cls()', lambda: cls()),
+        ('cls(**kwargs)', lambda: cls(**kwargs)),
+        ('load full', lambda: cls.load(full)),
+        ('load sparse', lambda: cls.load(sparse)),
+    ]
+    print(f'{WIDTH} fields, {NUMBER} iterations')
+    for name, fn in cases:
+        t = min(timeit.repeat(fn, number=NUMBER, repeat=3))
+        print(f'{name:15} {t / NUMBER * 1e6:8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
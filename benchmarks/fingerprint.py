@@ -0,0 +1,28 @@
+"""
+Fingerprint benchmark: fingerprint() against hashing dumps(sort_keys=True).
+
+Run from the repository root:
+    python -m benchmarks.fingerprint
+"""
+import hashlib
+import random
+import timeit
+
+from benchmarks.schemas import Record, make_record_json
+
+NUMBER = 5000
+
+
+def main():
+    obj = Record.load(make_record_json(1, random.Random(1)))
+    cases = [
+        ('sha256(dumps(sort_keys))', lambda: hashlib.sha256(obj.dumps(sort_keys=True).encode()).hexdigest()),
+        ('fingerprint()', lambda: obj.fingerprint()),
+    ]
+    for name, fn in cases:
+        t = min(timeit.repeat(fn, number=NUMBER, repeat=3))
+        print(f'{name:26} {t / NUMBER * 1e6:8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Lazy MapOf benchmark: loading a 100k-entry MapOf field and reading a few keys.
+
+Run from the repository root:
+    python -m benchmarks.lazy_map
+"""
+import timeit
+
+from jsonier import jsonified, Field, MapOf
+from benchmarks.schemas import Tag
+
+SIZE = 100000
+NUMBER = 5
+
+
+@jsonified
+class Eager:
+    tags = Field(MapOf[Tag])
+
+
+@jsonified
+class Lazy:
+    tags = Field(MapOf[Tag], lazy=True)
+
+
+def main():
+    json_data = {'tags': {f'k{i}': {'key': f'k{i}', 'value': f'v{i}'} for i in range(SIZE)}}
+
+    def lookup(cls):
+        obj = cls.load(json_data)
+        return [obj.tags[f'k{i}'].value for i in range(0, SIZE, SIZE // 10)]
+
+    cases = [
+        ('eager load + 10 lookups', lambda: lookup(Eager)),
+        ('lazy load + 10 lookups', lambda: lookup(Lazy)),
+        ('eager load + dump', lambda: Eager.load(json_data).dump()),
+        ('lazy load + dump', lambda: Lazy.load(json_data).dump()),
+    ]
+    print(f'{SIZE} entries')
+    for name, fn in cases:
+        t = min(timeit.repeat(fn, number=NUMBER, repeat=3))
+        print(f'{name:24} {t / NUMBER * 1e3:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
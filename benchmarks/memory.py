@@ -0,0 +1,55 @@
+"""
+Memory benchmark: bytes per loaded instance and peak allocation of load/loads/dump/dumps.
+
+Run from the repository root:
+    python -m benchmarks.memory
+"""
+import gc
+import json
+import random
+import tracemalloc
+
+from jsonier import deep_sizeof
+from benchmarks.schemas import Record, make_record_json
+
+COUNT = 2000
+
+
+def measure(fn):
+    """
+    Runs fn under tracemalloc.
+    :return: (result, bytes still allocated after the call, peak bytes during the call)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        result = fn()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, after - before, peak - before
+
+
+def main():
+    rng = random.Random(1)
+    records = [make_record_json(i, rng) for i in range(COUNT)]
+    payloads = [json.dumps(r) for r in records]
+
+    objs, retained, peak = measure(lambda: [Record.load(r) for r in records])
+    print(f'load:   {retained / COUNT:10.0f} B/instance retained, peak {peak / 1024:10.1f} KiB')
+    _, retained, peak = measure(lambda: [Record.loads(p) for p in payloads])
+    print(f'loads:  {retained / COUNT:10.0f} B/instance retained, peak {peak / 1024:10.1f} KiB')
+    _, retained, peak = measure(lambda: [o.dump() for o in objs])
+    print(f'dump:   {retained / COUNT:10.0f} B/instance retained, peak {peak / 1024:10.1f} KiB')
+    _, retained, peak = measure(lambda: [o.dumps() for o in objs])
+    print(f'dumps:  {retained / COUNT:10.0f} B/instance retained, peak {peak / 1024:10.1f} KiB')
+
+    seen = set()
+    total = sum(deep_sizeof(o, seen) for o in objs)
+    print(f'deep_sizeof: {total / COUNT:10.0f} B/instance')
+
+
+if __name__ == '__main__':
+    main()
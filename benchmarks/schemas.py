@@ -0,0 +1,56 @@
+"""
+Representative schemas shared by the benchmarks.
+"""
+import random
+
+from jsonier import jsonified, Field, ListOf, MapOf, Timestamp
+
+
+@jsonified
+class Tag:
+    key = Field(str, required=True)
+    value = Field(str)
+
+
+@jsonified
+class Meta:
+    tenant_id = Field(str, name='tenant-id', required=True)
+    created = Field(Timestamp[str])
+    updated = Field(Timestamp[int])
+    tags = Field(ListOf[Tag])
+
+
+@jsonified
+class Sample:
+    at = Field(Timestamp[float], required=True)
+    value = Field(float)
+
+
+@jsonified
+class Record:
+    id = Field(int, required=True)
+    name = Field(str, required=True)
+    active = Field(bool)
+    score = Field(float)
+    meta = Field(Meta)
+    samples = Field(ListOf[Sample])
+    labels = Field(MapOf[str])
+    children = Field(MapOf[Tag])
+
+
+def make_record_json(i: int, rng: random.Random = random) -> dict:
+    return {
+        'id': i,
+        'name': f'record-{i}',
+        'active': i % 2 == 0,
+        'score': rng.random() * 100,
+        'meta': {
+            'tenant-id': f'tenant-{i % 17}',
+            'created': '2021-04-05T10:11:12',
+            'updated': 1617617472 + i,
+            'tags': [{'key': f'k{j}', 'value': f'v{j}'} for j in range(3)],
+        },
+        'samples': [{'at': 1617617472.5 + j, 'value': rng.random()} for j in range(8)],
+        'labels': {f'l{j}': f'label-{j}' for j in range(4)},
+        'children': {f'c{j}': {'key': f'ck{j}', 'value': f'cv{j}'} for j in range(2)},
+    }
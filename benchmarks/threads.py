@@ -0,0 +1,46 @@
+"""
+Thread scaling benchmark: records per second with 1, 2, 4 and 8 threads,
+for load_many on a thread pool and for independent loads() calls from several threads.
+Scaling needs more than one core, and a free-threaded build to go beyond what the GIL allows.
+
+Run from the repository root:
+    python -m benchmarks.threads
+"""
+import json
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.schemas import Record, make_record_json
+
+COUNT = 8000
+THREADS = (1, 2, 4, 8)
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(1)
+    records = [make_record_json(i, rng) for i in range(1, COUNT + 1)]
+    payloads = [json.dumps(r) for r in records]
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'{COUNT} records, GIL {"enabled" if gil else "disabled"}')
+    for n in THREADS:
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            t_batch = min(timed(lambda: Record.load_many(records, executor=executor, chunk_size=COUNT // (4 * n)))
+                          for _ in range(3))
+            part = COUNT // n
+            t_loads = min(timed(lambda: list(executor.map(lambda k: [Record.loads(p)
+                                                                     for p in payloads[k * part:(k + 1) * part]],
+                                                           range(n))))
+                          for _ in range(3))
+        print(f'{n} threads: load_many {COUNT / t_batch:10.0f} rec/s | loads {COUNT / t_loads:10.0f} rec/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Timestamp list benchmark: ListOf[Timestamp[int]] / ListOf[Timestamp[float]] fields with many entries.
+
+Run from the repository root:
+    python -m benchmarks.timestamps
+"""
+import timeit
+
+from jsonier import jsonified, Field, ListOf, Timestamp
+
+SIZE = 50000
+NUMBER = 10
+
+
+@jsonified
+class Series:
+    ints = Field(ListOf[Timestamp[int]])
+    floats = Field(ListOf[Timestamp[float]])
+
+
+def main():
+    json_data = {
+        'ints': list(range(1600000000, 1600000000 + SIZE)),
+        'floats': [1600000000.25 + i for i in range(SIZE)],
+    }
+    obj = Series.load(json_data)
+    cases = [
+        ('load', lambda: Series.load(json_data)),
+        ('dump', lambda: obj.dump()),
+    ]
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        @jsonified
+        class ArraySeries:
+            ints = Field(ListOf[Timestamp[int]], numpy=True)
+            floats = Field(ListOf[Timestamp[float]], numpy=True)
+
+        arr = ArraySeries.load(json_data)
+        cases += [
+            ('load numpy', lambda: ArraySeries.load(json_data)),
+            ('dump numpy', lambda: arr.dump()),
+        ]
+    print(f'2 x {SIZE} timestamps')
+    for name, fn in cases:
+        t = min(timeit.repeat(fn, number=NUMBER, repeat=3))
+        print(f'{name:12} {t / NUMBER * 1e3:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -4,12 +4,29 @@ from jsonier.marshalling import (
     Jsonier,
     load,
     loads,
+    loadb,
+    load_many,
+    dump_many,
+    BatchResult,
+    BatchError,
+    scan,
+    dump_lines,
+    extract,
+    compile_path,
+    FieldPath,
     dump,
-    dumps
+    dumps,
+    clone,
+    canonical,
+    fingerprint,
+    parse_cache
 )
+from jsonier.memory import deep_sizeof
 from jsonier.adapter.timestamp import Timestamp
-from jsonier.adapter.map_of import MapOf
+from jsonier.adapter.map_of import MapOf, LazyMap
 from jsonier.adapter.list_of import ListOf
+from jsonier.adapter.one_of import OneOf
+from jsonier.adapter.union import Union, Any
 
 
 jsonified = Jsonier()
@@ -1,5 +1,7 @@
+import copy
 from typing import Optional
 
+from jsonier.util.canonical import Out, NULL, canonical_json
 from jsonier.util.typespec import JsonType
 
 
@@ -19,12 +21,57 @@ class Adapter:
         # for example, in MapOf[T] or ListOf[T] generic types, T itself needs parsing.
         return False
 
+    @staticmethod
+    def supports_array():
+        # return True if the adapter implements load_array() and dump_array()
+        return False
+
+    @staticmethod
+    def is_immutable():
+        # return True if loaded values are never modified in place and can be shared between copies,
+        # for example, ints, strings and datetimes.
+        return False
+
+    def json_types(self) -> tuple:
+        # types of JSON values that load() accepts, used to pick an adapter in Union fields
+        return ()
+
+    def python_types(self) -> tuple:
+        # types of values that dump() accepts, used to pick an adapter in Union fields
+        return ()
+
     def load(self, json_data):
         raise NotImplementedError('load')
 
     def dump(self, json_data) -> JsonType:
         raise NotImplementedError('dump')
 
+    def load_list(self, json_data: list) -> list:
+        # converts all items of a list; adapters with a faster bulk conversion override this
+        return [self.load(item) for item in json_data]
+
+    def dump_list(self, obj: list) -> list:
+        return [self.dump(item) for item in obj]
+
+    def load_array(self, json_data: list):
+        raise NotImplementedError('load_array')
+
+    def dump_array(self, obj) -> list:
+        raise NotImplementedError('dump_array')
+
+    def write_canonical(self, out: Out, obj):
+        # writes the canonical encoding of a value (see jsonier.util.canonical) into out
+        if obj is None:
+            out(NULL)
+        else:
+            out(canonical_json(self.dump(obj)))
+
+    def clone(self, obj):
+        # immutable values are shared and others deep-copied; adapters for containers and objects override this
+        if self.is_immutable():
+            return obj
+        return copy.deepcopy(obj)
+
     def zero(self):
         return self.default
 
@@ -1,4 +1,7 @@
+from typing import Optional
+
 from jsonier.adapter import Adapter
+from jsonier.util.canonical import Out, NULL, canonical_json
 from jsonier.util.typespec import (
     type_name, TypeSpec
 )
@@ -8,16 +11,81 @@ class ListOfAdapter(Adapter):
     def __init__(self, child: Adapter):
         super().__init__()
         self._child = child
+        self._share_items = child.is_immutable()
+        self._as_array = False
+
+    def set_options(self, options: Optional[dict] = None):
+        # numpy=True keeps the items in a NumPy array, if the item type supports it
+        self._child.set_options(options)
+        self._as_array = bool(options and options.get('numpy'))
+        if self._as_array and not self._child.supports_array():
+            raise TypeError(f'{type(self._child).__name__} items cannot be stored in an array')
+        if self._as_array and isinstance(self.default, list):
+            # the default becomes an array too; its items can be Python values or their JSON form
+            child = self._child
+            python_types = child.python_types()
+            self.default = child.load_array([child.dump(item) if isinstance(item, python_types) else item
+                                             for item in self.default])
+
+    def json_types(self) -> tuple:
+        return (list,)
+
+    def python_types(self) -> tuple:
+        return (list,)
 
     def load(self, json_data: list):
         if not isinstance(json_data, list):
             raise TypeError(f'Expecting a list, got {type(json_data)} instead')
-        return [self._child.load(item) for item in json_data]
+        if self._as_array:
+            return self._child.load_array(json_data)
+        return self._child.load_list(json_data)
 
     def dump(self, obj: list):
+        if self._as_array:
+            return self._child.dump_array(obj)
         if not isinstance(obj, list):
             raise TypeError(f'Expecting a list, got {type_name(obj)} instead')
-        return [self._child.dump(item) for item in obj]
+        return self._child.dump_list(obj)
+
+    def load_list(self, json_data: list) -> list:
+        # Lists of lists are converted as one flat list, so that the items of all of them
+        # go through the child's bulk conversion together.
+        if self._as_array or not all(type(item) is list for item in json_data):
+            return super().load_list(json_data)
+        return _split(self._child.load_list([x for item in json_data for x in item]), json_data)
+
+    def dump_list(self, obj: list) -> list:
+        if self._as_array or not all(type(item) is list for item in obj):
+            return super().dump_list(obj)
+        return _split(self._child.dump_list([x for item in obj for x in item]), obj)
+
+    def is_empty(self, obj):
+        return obj is None or len(obj) == 0
+
+    def write_canonical(self, out: Out, obj):
+        if obj is None:
+            out(NULL)
+            return
+        if self._as_array:
+            out(canonical_json(self.dump(obj)))
+            return
+        child = self._child
+        out(b'[')
+        for i, item in enumerate(obj):
+            if i:
+                out(b',')
+            child.write_canonical(out, item)
+        out(b']')
+
+    def clone(self, obj):
+        if obj is None:
+            return None
+        if self._as_array:
+            return obj.copy()
+        if self._share_items:
+            return list(obj)
+        child = self._child
+        return [child.clone(item) for item in obj]
 
     def set_default(self, default):
         if default is None:
@@ -25,10 +93,33 @@ class ListOfAdapter(Adapter):
         else:
             self.default = list(default)
 
+    def zero(self):
+        # every caller gets its own copy of a mutable default
+        if self.default is None:
+            return None
+        if self._as_array:
+            return self.default.copy()
+        return list(self.default)
+
     @staticmethod
     def needs_param_parsing():
         # In ListOf[T], T itself needs parsing.
         return True
 
+    @staticmethod
+    def is_immutable():
+        return False
+
+
+def _split(flat: list, lists: list) -> list:
+    # cuts flat into pieces of the same lengths as lists
+    result = []
+    pos = 0
+    for item in lists:
+        end = pos + len(item)
+        result.append(flat[pos:end])
+        pos = end
+    return result
+
 
 ListOf = TypeSpec(TypeSpec.ListOf)
@@ -1,32 +1,174 @@
+from collections.abc import MutableMapping
+from typing import Optional
+
 from jsonier.adapter import Adapter
+from jsonier.marshalling import _MISSING
+from jsonier.util.canonical import Out, NULL, canonical_str
 from jsonier.util.typespec import type_name, TypeSpec
 
 
+class LazyMap(MutableMapping):
+    """
+    Dictionary returned by lazy MapOf fields.
+    It holds the raw JSON values and converts each one through the child adapter on first access.
+    Reads never copy the raw dict; it is copied on the first write.
+    """
+
+    def __init__(self, child: Adapter, json_data: dict):
+        self._child = child
+        self._raw = json_data  # key -> raw value, or a placeholder for keys that were assigned
+        self._converted = {}  # key -> converted value, for keys that were accessed or assigned
+        self._owned = False  # _raw is the caller's dict until the first write
+
+    def _own(self):
+        if not self._owned:
+            self._raw = dict(self._raw)
+            self._owned = True
+
+    def __getitem__(self, key):
+        value = self._converted.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = self._child.load(self._raw[key])
+        # if two threads convert the same key, both get the value that was stored first
+        return self._converted.setdefault(key, value)
+
+    def __setitem__(self, key, value):
+        self._own()
+        self._raw[key] = None
+        self._converted[key] = value
+
+    def __delitem__(self, key):
+        self._own()
+        del self._raw[key]
+        self._converted.pop(key, None)
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __contains__(self, key):
+        return key in self._raw
+
+    def __repr__(self):
+        return f'LazyMap({len(self._raw)} items, {len(self._converted)} loaded)'
+
+    def dump(self) -> dict:
+        # values that were never accessed are passed through as they came in
+        converted = self._converted
+        child = self._child
+        return {k: child.dump(converted[k]) if k in converted else v for k, v in self._raw.items()}
+
+    def clone(self) -> 'LazyMap':
+        other = LazyMap(self._child, self._raw)
+        if self._owned:
+            other._own()
+        if self._child.is_immutable():
+            other._converted = dict(self._converted)
+        else:
+            child = self._child
+            other._converted = {k: child.clone(v) for k, v in self._converted.items()}
+        return other
+
+
 class MapOfAdapter(Adapter):
     # In MapOf[T], T itself needs parsing.
     @staticmethod
     def needs_param_parsing():
         return True
 
+    @staticmethod
+    def is_immutable():
+        return False
+
     def __init__(self, child: Adapter):
         super().__init__()
         self._child = child
+        self._share_items = child.is_immutable()
+        self._lazy = False
+
+    def set_options(self, options: Optional[dict] = None):
+        # lazy=True converts the values on first access, see LazyMap
+        self._child.set_options(options)
+        self._lazy = bool(options and options.get('lazy'))
+
+    def json_types(self) -> tuple:
+        return (dict,)
+
+    def python_types(self) -> tuple:
+        return (dict, LazyMap)
 
     def load(self, json_data: dict):
         if not isinstance(json_data, dict):
             raise TypeError(f'Expecting a dict, got {type(json_data)} instead')
+        if self._lazy:
+            return LazyMap(self._child, json_data)
         return {k: self._child.load(v) for k, v in json_data.items()}
 
     def dump(self, obj: dict):
+        if isinstance(obj, LazyMap):
+            return obj.dump()
         if not isinstance(obj, dict):
             raise TypeError(f'Expecting a dict, got {type_name(obj)} instead')
         return {k: self._child.dump(v) for k, v in obj.items()}
 
+    def load_list(self, json_data: list) -> list:
+        # The values of all dicts are converted as one flat list, through the child's bulk conversion.
+        if self._lazy or not all(type(item) is dict for item in json_data):
+            return super().load_list(json_data)
+        return _rebuild(self._child.load_list([v for item in json_data for v in item.values()]), json_data)
+
+    def dump_list(self, obj: list) -> list:
+        if not all(type(item) is dict for item in obj):
+            return super().dump_list(obj)
+        return _rebuild(self._child.dump_list([v for item in obj for v in item.values()]), obj)
+
+    def write_canonical(self, out: Out, obj):
+        if obj is None:
+            out(NULL)
+            return
+        child = self._child
+        out(b'{')
+        for i, k in enumerate(sorted(obj)):
+            if i:
+                out(b',')
+            out(canonical_str(k))
+            out(b':')
+            child.write_canonical(out, obj[k])
+        out(b'}')
+
+    def clone(self, obj):
+        if obj is None:
+            return None
+        if isinstance(obj, LazyMap):
+            return obj.clone()
+        if self._share_items:
+            return dict(obj)
+        child = self._child
+        return {k: child.clone(v) for k, v in obj.items()}
+
     def set_default(self, default):
         if default is None:
             self.default = None
         else:
             self.default = dict(default)
 
+    def zero(self):
+        # every caller gets its own copy of a mutable default
+        if self.default is None:
+            return None
+        return dict(self.default)
+
+
+def _rebuild(flat_values: list, dicts: list) -> list:
+    # pairs the keys of each dict with the next values from flat_values
+    result = []
+    values = iter(flat_values)
+    for item in dicts:
+        result.append(dict(zip(item, values)))
+    return result
+
 
 MapOf = TypeSpec(TypeSpec.MapOf)
@@ -1,7 +1,10 @@
 from typing import Optional
 
 from jsonier.adapter import Adapter
-from jsonier.marshalling import require_jsonified, load, dump
+from jsonier.marshalling import (
+    require_jsonified, load, dump, clone, write_canonical, load_many, dump_many, is_shareable,
+)
+from jsonier.util.canonical import Out, NULL
 from jsonier.util.typespec import type_name
 
 
@@ -11,6 +14,18 @@ class ObjectAdapter(Adapter):
         require_jsonified(child)
         self._child = child
 
+    def is_immutable(self):
+        return is_shareable(self._child)
+
+    def child_class(self) -> type:
+        return self._child
+
+    def json_types(self) -> tuple:
+        return (dict,)
+
+    def python_types(self) -> tuple:
+        return (self._child,)
+
     def load(self, json_data: Optional[dict]):
         if json_data is None:
             return None
@@ -25,6 +40,29 @@ class ObjectAdapter(Adapter):
             raise TypeError(f'Expecting a {self._child.__name__}, got {type_name(obj)} instead')
         return dump(obj)
 
+    def write_canonical(self, out: Out, obj):
+        if obj is None:
+            out(NULL)
+        else:
+            write_canonical(obj, out)
+
+    def clone(self, obj):
+        if obj is None or self.is_immutable():
+            return obj
+        return clone(obj)
+
+    def load_list(self, json_data: list) -> list:
+        # batches of objects are converted field by field
+        if not all(isinstance(item, dict) for item in json_data):
+            return super().load_list(json_data)
+        return load_many(self._child, json_data)
+
+    def dump_list(self, obj: list) -> list:
+        # only objects of exactly the child class are dumped field by field, subclasses can have more fields
+        if not all(type(item) is self._child for item in obj):
+            return super().dump_list(obj)
+        return dump_many(self._child, obj)
+
     def set_default(self, default):
         if default is None:
             self.default = None
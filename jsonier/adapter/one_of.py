@@ -0,0 +1,105 @@
+from typing import Optional
+
+from jsonier.adapter import Adapter
+from jsonier.marshalling import require_jsonified, load, dump, clone, write_canonical, _FIELDS
+from jsonier.util.canonical import Out, NULL, canonical_str
+from jsonier.util.typespec import type_name, TypeSpec
+
+
+class OneOfAdapter(Adapter):
+    """
+    Adapter for tagged unions: OneOf[Cat, Dog] or OneOf[('cat', Cat), ('dog', Dog)].
+    The tag of a plain class is its name. The JSON key holding the tag is set with
+    the `discriminator` field option and defaults to 'type'.
+    """
+
+    def __init__(self, choices):
+        super().__init__()
+        if not isinstance(choices, tuple) or _is_tagged(choices):
+            choices = (choices,)  # OneOf[Cat] or OneOf[('cat', Cat)]
+        self._key = 'type'
+        self._tag_to_class = {}
+        self._class_to_tag = {}
+        for choice in choices:
+            if isinstance(choice, tuple):
+                tag, cls = choice
+            else:
+                tag, cls = choice.__name__, choice
+            require_jsonified(cls)
+            if tag in self._tag_to_class:
+                raise TypeError(f'Duplicate tag `{tag}` in OneOf')
+            self._tag_to_class[tag] = cls
+            self._class_to_tag[cls] = tag
+
+    def _check_key(self):
+        # the tag is written under the discriminator key, so no choice may have a field with that JSON name
+        for cls in self._class_to_tag:
+            for field in getattr(cls, _FIELDS).values():
+                if field.name == self._key:
+                    raise TypeError(f'{cls.__name__} has a field named `{self._key}`, '
+                                    f'which is used as the OneOf discriminator')
+
+    @staticmethod
+    def is_immutable():
+        return False
+
+    def json_types(self) -> tuple:
+        return (dict,)
+
+    def python_types(self) -> tuple:
+        return tuple(self._class_to_tag)
+
+    def set_options(self, options: Optional[dict] = None):
+        if options and 'discriminator' in options:
+            self._key = options['discriminator']
+        self._check_key()
+
+    def load(self, json_data: Optional[dict]):
+        if json_data is None:
+            return None
+        if not isinstance(json_data, dict):
+            raise TypeError(f'Expecting a dict, got {type_name(json_data)} instead')
+        try:
+            tag = json_data[self._key]
+        except KeyError:
+            raise ValueError(f'Discriminator `{self._key}` is missing')
+        try:
+            cls = self._tag_to_class[tag]
+        except (KeyError, TypeError):
+            raise ValueError(f'Unknown `{self._key}` tag: {tag!r}')
+        return load(cls, json_data)
+
+    def dump(self, obj):
+        if obj is None:
+            return None
+        try:
+            tag = self._class_to_tag[obj.__class__]
+        except KeyError:
+            raise TypeError(f'Unexpected type {type_name(obj)} for OneOf field')
+        json_data = dump(obj)
+        json_data[self._key] = tag
+        return json_data
+
+    def write_canonical(self, out: Out, obj):
+        if obj is None:
+            out(NULL)
+            return
+        try:
+            tag = self._class_to_tag[obj.__class__]
+        except KeyError:
+            raise TypeError(f'Unexpected type {type_name(obj)} for OneOf field')
+        out(canonical_str(tag))
+        out(b':')
+        write_canonical(obj, out)
+
+    def clone(self, obj):
+        if obj is None:
+            return None
+        return clone(obj)
+
+
+def _is_tagged(choice) -> bool:
+    return isinstance(choice, tuple) and len(choice) == 2 and isinstance(choice[0], str)
+
+
+OneOf = TypeSpec(TypeSpec.OneOf)
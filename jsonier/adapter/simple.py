@@ -1,57 +1,141 @@
 from jsonier.adapter import Adapter
+from jsonier.util.canonical import (
+    Out,
+    TRUE,
+    FALSE,
+    canonical_int,
+    canonical_float,
+    canonical_str
+)
 
 
 class IntAdapter(Adapter):
+    @staticmethod
+    def is_immutable():
+        return True
+
+    def json_types(self) -> tuple:
+        return (int,)
+
+    def python_types(self) -> tuple:
+        return (int,)
+
     def load(self, json_data) -> int:
         return int(json_data)
 
     def dump(self, json_data) -> int:
         return int(json_data)
 
+    def load_list(self, json_data: list) -> list:
+        return list(map(int, json_data))
+
+    def dump_list(self, obj: list) -> list:
+        return list(map(int, obj))
+
     def set_default(self, default):
         if default is None:
             self.default = 0
         else:
             self.default = int(default)
 
+    def write_canonical(self, out: Out, obj):
+        out(canonical_int(int(obj)))
+
 
 class FloatAdapter(Adapter):
+    @staticmethod
+    def is_immutable():
+        return True
+
+    def json_types(self) -> tuple:
+        return (float, int)
+
+    def python_types(self) -> tuple:
+        return (float, int)
+
     def load(self, json_data) -> float:
         return float(json_data)
 
     def dump(self, json_data) -> float:
         return float(json_data)
 
+    def load_list(self, json_data: list) -> list:
+        return list(map(float, json_data))
+
+    def dump_list(self, obj: list) -> list:
+        return list(map(float, obj))
+
     def set_default(self, default):
         if default is None:
             self.default = 0.0
         else:
             self.default = float(default)
 
+    def write_canonical(self, out: Out, obj):
+        out(canonical_float(float(obj)))
+
 
 class StringAdapter(Adapter):
+    @staticmethod
+    def is_immutable():
+        return True
+
+    def json_types(self) -> tuple:
+        return (str,)
+
+    def python_types(self) -> tuple:
+        return (str,)
+
     def load(self, json_data) -> str:
         return str(json_data)
 
     def dump(self, json_data) -> str:
         return str(json_data)
 
+    def load_list(self, json_data: list) -> list:
+        return list(map(str, json_data))
+
+    def dump_list(self, obj: list) -> list:
+        return list(map(str, obj))
+
     def set_default(self, default):
         if default is None:
             self.default = ''
         else:
             self.default = str(default)
 
+    def write_canonical(self, out: Out, obj):
+        out(canonical_str(str(obj)))
+
 
 class BoolAdapter(Adapter):
+    @staticmethod
+    def is_immutable():
+        return True
+
+    def json_types(self) -> tuple:
+        return (bool,)
+
+    def python_types(self) -> tuple:
+        return (bool,)
+
     def load(self, json_data) -> bool:
         return bool(json_data)
 
     def dump(self, json_data) -> bool:
         return bool(json_data)
 
+    def load_list(self, json_data: list) -> list:
+        return list(map(bool, json_data))
+
+    def dump_list(self, obj: list) -> list:
+        return list(map(bool, obj))
+
     def set_default(self, default):
         if default is None:
             self.default = False
         else:
-            self.default = bool(default)
\ No newline at end of file
+            self.default = bool(default)
+
+    def write_canonical(self, out: Out, obj):
+        out(TRUE if obj else FALSE)
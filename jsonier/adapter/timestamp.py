@@ -9,12 +9,28 @@ from jsonier.util.datetimeutil import (
     float_to_datetime,
     datetime_to_float,
     int_to_datetime,
-    datetime_to_int
+    datetime_to_int,
+    ints_to_datetimes,
+    datetimes_to_ints,
+    floats_to_datetimes,
+    datetimes_to_floats,
+    strs_to_datetimes,
+    datetimes_to_strs,
+    autos_to_datetimes,
+    ints_to_datetime64,
+    datetime64_to_ints,
+    floats_to_datetime64,
+    datetime64_to_floats
 )
+from jsonier.util.canonical import Out, NULL, canonical_datetime
 from jsonier.util.typespec import TypeSpec
 
 
 class TimestampBaseAdapter(Adapter):
+    @staticmethod
+    def is_immutable():
+        return True
+
     def set_default(self, default):
         if default is None:
             self.default = None
@@ -27,8 +43,38 @@ class TimestampBaseAdapter(Adapter):
     def dump(self, json_data) -> Optional[str]:
         raise NotImplementedError('to_json')
 
+    def python_types(self) -> tuple:
+        return (datetime,)
+
+    def write_canonical(self, out: Out, obj):
+        # all timestamp flavors are written the same way, as microseconds since the epoch
+        if obj is None:
+            out(NULL)
+        else:
+            out(canonical_datetime(auto_to_datetime(obj)))
+
+    def load_list(self, json_data: list) -> list:
+        # Converts the whole list at once, skipping the per-item None checks.
+        # Lists with nulls (or bad values) fail in the fast path and are redone item by item.
+        try:
+            return self._load_all(json_data)
+        except (TypeError, AttributeError):
+            return [self.load(item) for item in json_data]
+
+    def dump_list(self, obj: list) -> list:
+        try:
+            return self._dump_all(obj)
+        except (TypeError, AttributeError):
+            return [self.dump(item) for item in obj]
+
 
 class TimestampStrAdapter(TimestampBaseAdapter):
+    _load_all = staticmethod(strs_to_datetimes)
+    _dump_all = staticmethod(datetimes_to_strs)
+
+    def json_types(self) -> tuple:
+        return (str,)
+
     def load(self, json_data) -> Optional[datetime]:
         if json_data is None:
             return None
@@ -41,6 +87,12 @@ class TimestampStrAdapter(TimestampBaseAdapter):
 
 
 class TimestampFloatAdapter(TimestampBaseAdapter):
+    _load_all = staticmethod(floats_to_datetimes)
+    _dump_all = staticmethod(datetimes_to_floats)
+
+    def json_types(self) -> tuple:
+        return (float, int)
+
     def load(self, json_data) -> Optional[datetime]:
         if json_data is None:
             return None
@@ -51,8 +103,24 @@ class TimestampFloatAdapter(TimestampBaseAdapter):
             return None
         return datetime_to_float(obj_data)
 
+    @staticmethod
+    def supports_array():
+        return True
+
+    def load_array(self, json_data: list):
+        return floats_to_datetime64(json_data)
+
+    def dump_array(self, obj) -> list:
+        return datetime64_to_floats(obj)
+
 
 class TimestampIntAdapter(TimestampBaseAdapter):
+    _load_all = staticmethod(ints_to_datetimes)
+    _dump_all = staticmethod(datetimes_to_ints)
+
+    def json_types(self) -> tuple:
+        return (int,)
+
     def load(self, json_data) -> Optional[datetime]:
         if json_data is None:
             return None
@@ -63,8 +131,24 @@ class TimestampIntAdapter(TimestampBaseAdapter):
             return None
         return datetime_to_int(obj_data)
 
+    @staticmethod
+    def supports_array():
+        return True
+
+    def load_array(self, json_data: list):
+        return ints_to_datetime64(json_data)
+
+    def dump_array(self, obj) -> list:
+        return datetime64_to_ints(obj)
+
 
 class TimestampAutoAdapter(TimestampBaseAdapter):
+    _load_all = staticmethod(autos_to_datetimes)
+    _dump_all = staticmethod(datetimes_to_strs)
+
+    def json_types(self) -> tuple:
+        return (str, int, float)
+
     def load(self, json_data) -> Optional[datetime]:
         if json_data is None:
             return None
@@ -0,0 +1,228 @@
+from datetime import datetime
+from operator import methodcaller
+from typing import Callable, Optional
+
+from jsonier.adapter import Adapter
+from jsonier.marshalling import dump, clone, is_jsonified, write_canonical
+from jsonier.util.canonical import Out, NULL, canonical_str, canonical_json, canonical_float, canonical_datetime
+from jsonier.util.datetimeutil import datetime_to_str
+from jsonier.util.typespec import type_name, TypeSpec, TypeSpecMap, NoneType
+
+_json_types = methodcaller('json_types')
+_python_types = methodcaller('python_types')
+
+
+def _covers(types: tuple, t: type) -> bool:
+    # bools are ints in Python, but not in JSON: they only go to choices that ask for them
+    if t is bool:
+        return bool in types or object in types
+    return issubclass(t, types)
+
+
+class UnionAdapter(Adapter):
+    """
+    Adapter for fields that can hold values of several types: Union[int, str], Union[Address, ListOf[str]].
+    Each value goes to the first choice that accepts its runtime type (the JSON type on load,
+    the Python type on dump). Choices are looked up in per-type tables, which also remember
+    the outcome for subclasses. A choice whose JSON types are all taken by earlier ones is an error.
+    """
+
+    @staticmethod
+    def needs_param_parsing():
+        # In Union[A, B], A and B need parsing.
+        return True
+
+    def __init__(self, choices):
+        super().__init__()
+        if not isinstance(choices, tuple):
+            choices = (choices,)
+        self._choices = choices
+        self._loaders = TypeSpecMap()  # JSON type -> adapter
+        self._dumpers = TypeSpecMap()  # Python type -> adapter
+        taken = ()  # JSON types of earlier choices
+        for i, adapter in enumerate(choices):
+            if not adapter.json_types() and not adapter.python_types():
+                raise TypeError(f'{type(adapter).__name__} cannot be used in a Union')
+            free = tuple(t for t in adapter.json_types() if not _covers(taken, t))
+            if adapter.json_types() and not free:
+                raise TypeError(f'Choice {i + 1} of Union ({type(adapter).__name__}) would never be loaded, '
+                                f'earlier choices take all its JSON types; use OneOf to tell objects apart by a tag')
+            for t in free:
+                self._loaders.set(t, adapter)
+            taken += free
+        for adapter in reversed(choices):  # so that earlier choices win
+            for t in adapter.python_types():
+                self._dumpers.set(t, adapter)
+
+    def set_options(self, options: Optional[dict] = None):
+        for adapter in self._choices:
+            adapter.set_options(options)
+
+    def json_types(self) -> tuple:
+        return tuple(t for adapter in self._choices for t in adapter.json_types())
+
+    def python_types(self) -> tuple:
+        return tuple(t for adapter in self._choices for t in adapter.python_types())
+
+    def is_immutable(self):
+        return all(adapter.is_immutable() for adapter in self._choices)
+
+    def _dispatch(self, table: TypeSpecMap, types: Callable[[Adapter], tuple], value) -> Adapter:
+        t = type(value)
+        try:
+            adapter = table.get(t)
+        except KeyError:
+            # a subclass of some accepted type, resolve it once and remember the result
+            adapter = next((a for a in self._choices if _covers(types(a), t)), None)
+            table.set(t, adapter)
+        if adapter is None:
+            raise TypeError(f'Unexpected type {type_name(value)} for Union field')
+        return adapter
+
+    def load(self, json_data):
+        if json_data is None:
+            return None
+        return self._dispatch(self._loaders, _json_types, json_data).load(json_data)
+
+    def dump(self, obj):
+        if obj is None:
+            return None
+        return self._dispatch(self._dumpers, _python_types, obj).dump(obj)
+
+    def write_canonical(self, out: Out, obj):
+        if obj is None:
+            out(NULL)
+        else:
+            self._dispatch(self._dumpers, _python_types, obj).write_canonical(out, obj)
+
+    def clone(self, obj):
+        if obj is None:
+            return None
+        return self._dispatch(self._dumpers, _python_types, obj).clone(obj)
+
+    def zero(self):
+        # every caller gets its own copy of a mutable default
+        return self.clone(self.default)
+
+
+def _dump_list(adapter: 'AnyAdapter', obj) -> list:
+    return [adapter.dump(item) for item in obj]
+
+
+def _dump_dict(adapter: 'AnyAdapter', obj) -> dict:
+    return {k: adapter.dump(v) for k, v in obj.items()}
+
+
+def _dump_as_is(adapter: 'AnyAdapter', obj):
+    return obj
+
+
+def _dump_object(adapter: 'AnyAdapter', obj) -> dict:
+    return dump(obj)
+
+
+def _dump_datetime(adapter: 'AnyAdapter', obj) -> str:
+    return datetime_to_str(obj)
+
+
+class AnyAdapter(Adapter):
+    """
+    Adapter for fields that take any JSON value. Values are loaded as they are, with lists and dicts copied.
+    On dump, jsonified objects, timestamps, lists and dicts are converted by their runtime type,
+    through a per-type table of converters.
+    """
+
+    def __init__(self, arg=None):
+        super().__init__()
+        self._dumpers = TypeSpecMap()
+        for t in (int, float, str, bool, NoneType):
+            self._dumpers.set(t, _dump_as_is)
+        self._dumpers.set(list, _dump_list)
+        self._dumpers.set(tuple, _dump_list)
+        self._dumpers.set(dict, _dump_dict)
+        self._dumpers.set(datetime, _dump_datetime)
+
+    def json_types(self) -> tuple:
+        return (object,)
+
+    def python_types(self) -> tuple:
+        return (object,)
+
+    @staticmethod
+    def is_immutable():
+        return False
+
+    def _dumper(self, obj) -> Callable:
+        t = type(obj)
+        try:
+            return self._dumpers.get(t)
+        except KeyError:
+            pass
+        if is_jsonified(t):
+            dumper = _dump_object
+        elif issubclass(t, (int, float, str)):
+            dumper = _dump_as_is
+        elif issubclass(t, (list, tuple)):
+            dumper = _dump_list
+        elif issubclass(t, dict):
+            dumper = _dump_dict
+        elif issubclass(t, datetime):
+            dumper = _dump_datetime
+        else:
+            raise TypeError(f'Cannot convert {type_name(obj)} to JSON')
+        self._dumpers.set(t, dumper)
+        return dumper
+
+    def load(self, json_data):
+        # lists and dicts are copied, so that the object does not share them with the caller's JSON data
+        if isinstance(json_data, list):
+            return [self.load(item) for item in json_data]
+        if isinstance(json_data, dict):
+            return {k: self.load(v) for k, v in json_data.items()}
+        return json_data
+
+    def dump(self, obj):
+        return self._dumper(obj)(self, obj)
+
+    def write_canonical(self, out: Out, obj):
+        if is_jsonified(type(obj)):
+            write_canonical(obj, out)
+        elif isinstance(obj, dict):
+            out(b'{')
+            for i, k in enumerate(sorted(obj)):
+                if i:
+                    out(b',')
+                out(canonical_str(k))
+                out(b':')
+                self.write_canonical(out, obj[k])
+            out(b'}')
+        elif isinstance(obj, (list, tuple)):
+            out(b'[')
+            for i, item in enumerate(obj):
+                if i:
+                    out(b',')
+                self.write_canonical(out, item)
+            out(b']')
+        elif isinstance(obj, float):
+            out(canonical_float(obj))
+        elif isinstance(obj, datetime):
+            out(canonical_datetime(obj))
+        else:
+            out(canonical_json(self.dump(obj)))
+
+    def clone(self, obj):
+        if is_jsonified(type(obj)):
+            return clone(obj)
+        if isinstance(obj, (list, tuple)):
+            return [self.clone(item) for item in obj]
+        if isinstance(obj, dict):
+            return {k: self.clone(v) for k, v in obj.items()}
+        return obj
+
+    def zero(self):
+        # every caller gets its own copy of a mutable default
+        return self.clone(self.default)
+
+
+Union = TypeSpec(TypeSpec.Union)
+Any = TypeSpec(TypeSpec.Any)
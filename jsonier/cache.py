@@ -0,0 +1,72 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Optional, Union
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+def payload_key(data: Union[str, bytes, bytearray]) -> bytes:
+    """
+    Content address of a JSON payload. Strings and bytes with the same UTF-8 content share a key.
+    :param data: raw JSON text
+    :return: 16-byte digest
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8', 'surrogatepass')
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of parsed objects, keyed by the digest of the raw payload.
+    Entries older than `ttl` seconds (if given) are treated as misses and dropped.
+    """
+
+    def __init__(self,
+                 maxsize: int = 128,
+                 ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if maxsize <= 0:
+            raise ValueError(f'Cache size must be positive, got {maxsize}')
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expiry time, value)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: bytes, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or self._clock() < expires:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+                self._evictions += 1
+            self._misses += 1
+            return default
+
+    def put(self, key: bytes, value: Any):
+        expires = None if self._ttl is None else self._clock() + self._ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._entries))
@@ -3,6 +3,8 @@ from datetime import datetime
 from jsonier.adapter.timestamp import Timestamp
 from jsonier.adapter.map_of import MapOf
 from jsonier.adapter.list_of import ListOf
+from jsonier.adapter.one_of import OneOf
+from jsonier.adapter.union import Union, Any
 
 from jsonier.adapter.simple import (
     IntAdapter,
@@ -13,6 +15,8 @@ from jsonier.adapter.simple import (
 from jsonier.adapter.list_of import ListOfAdapter
 from jsonier.adapter.map_of import MapOfAdapter
 from jsonier.adapter.object import ObjectAdapter
+from jsonier.adapter.one_of import OneOfAdapter
+from jsonier.adapter.union import UnionAdapter, AnyAdapter
 from jsonier.adapter.timestamp import (
     TimestampStrAdapter,
     TimestampFloatAdapter,
@@ -31,6 +35,9 @@ def register_handlers(jsonier):
     parser.register(datetime, TimestampAutoAdapter)
     parser.register(MapOf[...], MapOfAdapter)
     parser.register(ListOf[...], ListOfAdapter)
+    parser.register(OneOf[...], OneOfAdapter)
+    parser.register(Union[...], UnionAdapter)
+    parser.register(Any, AnyAdapter)
     parser.register(Timestamp, TimestampAutoAdapter)
     parser.register(Timestamp[int], TimestampIntAdapter)
     parser.register(Timestamp[str], TimestampStrAdapter)
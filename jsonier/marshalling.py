@@ -1,18 +1,46 @@
+import hashlib
 import json
 import logging
+import os
+import threading
+import weakref
+from collections import namedtuple
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from datetime import datetime
+from functools import lru_cache
 from types import MethodType
 from typing import (
     Any,
+    BinaryIO,
     Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
     Union, Dict
 )
 
 from jsonier.adapter import Adapter
-from jsonier.util.typespec import TypeSpecMap, TypeSpec
+from jsonier.cache import ParseCache, payload_key
+from jsonier.util.canonical import Out, canonical_str
+from jsonier.util.compression import Source, open_lines, open_writer
+from jsonier.util.typespec import TypeSpecMap, TypeSpec, is_atomic, type_name
 
 _FIELDS = '__JSON'
+_FROZEN = '__JSON_FROZEN'
+_SHAREABLE = '__JSON_SHAREABLE'  # frozen classes that only hold immutable values
+_CACHE = '__JSON_CACHE'
+_CANONICAL = '__JSON_CANONICAL'  # fields in the order of their JSON keys
 _MISSING = (None,)  # a special value indicating that a value is not specified (but is not None)
 
+# Serializes changes to classes (jsonifying them) across all Jsonier instances.
+_class_lock = threading.RLock()
+
+BatchError = namedtuple('BatchError', ['index', 'error'])
+BatchResult = namedtuple('BatchResult', ['items', 'errors'])
+
 
 def require_jsonified(cls):
     if not is_jsonified(cls):
@@ -23,16 +51,40 @@ def is_jsonified(cls):
     return hasattr(cls, _FIELDS)
 
 
+def is_frozen(cls):
+    return getattr(cls, _FROZEN, False)
+
+
+def is_shareable(cls):
+    # instances of such classes cannot be modified, not even through their lists and dicts
+    return getattr(cls, _SHAREABLE, False)
+
+
+def parse_cache(cls) -> Optional[ParseCache]:
+    """
+    :return: the cache used by cls.loads()/cls.loadb(), or None if caching is off for this class
+    """
+    return cls.__dict__.get(_CACHE)
+
+
 class TypeSpecParser:
+    """
+    Maps types and typespecs to adapters.
+    Registration is serialized by a lock, parsing only reads and takes no lock.
+    """
+
     def __init__(self):
         self._type_handlers = TypeSpecMap()
         self._default_handler = None
+        self._lock = threading.Lock()
 
     def register(self, ts: Union[type, TypeSpec], handler: Callable, recurse: bool = False):
-        self._type_handlers.set(ts, handler)
+        with self._lock:
+            self._type_handlers.set(ts, handler)
 
     def register_default_handler(self, handler: Callable):
-        self._default_handler = handler
+        with self._lock:
+            self._default_handler = handler
 
     def parse_typespec(self, ts):
         if isinstance(ts, TypeSpec):  # a type-spec class with optional argumants
@@ -50,7 +102,10 @@ class TypeSpecParser:
             else:
                 raise TypeError(f'Don\'t know how to handle type: {ts}')
         if type_handler.needs_param_parsing():
-            arg = self.parse_typespec(arg)
+            if isinstance(arg, tuple):  # several parameters, as in Union[int, str]
+                arg = tuple(self.parse_typespec(a) for a in arg)
+            else:
+                arg = self.parse_typespec(arg)
         return type_handler(arg)
 
 
@@ -85,50 +140,170 @@ class FieldHandler:
         self._allow_null = allow_null
 
     def read(self, json_data: dict):
-        try:
-            json_value = json_data[self._name]
-            if json_value is None and self._allow_null:
-                return self._adapter.zero()
-        except KeyError:
+        v = self.read_present(json_data)
+        if v is _MISSING:
+            return self._adapter.zero()
+        return v
+
+    def read_present(self, json_data: dict):
+        """
+        Like read(), but returns _MISSING instead of the zero value when the field is absent
+        (or null, if nulls are allowed), so that the caller can leave the class-level default in place.
+        """
+        json_value = json_data.get(self._name, _MISSING)
+        if json_value is _MISSING:
             if self._required:
                 raise ValueError(f'Required field {self._name} is missing.')
-            return self._adapter.zero()
+            return _MISSING
+        if json_value is None and self._allow_null:
+            return _MISSING
         return self._adapter.load(json_value)
 
+    def read_column(self, json_list: List[dict], on_error: Callable[[int, Exception], None]) -> list:
+        """
+        Reads the field from a batch of records. The whole column is converted at once
+        when every record has a value, otherwise, or if that fails, record by record.
+        :param on_error: called with the index and the error of each record that fails
+        :return: values (or _MISSING) for each record
+        """
+        name = self._name
+        column = [json_data.get(name, _MISSING) for json_data in json_list]
+        if _MISSING not in column and None not in column:
+            try:
+                return self._adapter.load_list(column)
+            except (TypeError, ValueError):
+                pass  # find out which records fail
+        values = []
+        for i, json_data in enumerate(json_list):
+            try:
+                values.append(self.read_present(json_data))
+            except (TypeError, ValueError) as e:
+                on_error(i, e)
+                values.append(_MISSING)
+        return values
+
+    def write_column(self, json_list: List[dict], attr_values: list, on_error: Callable[[int, Exception], None]):
+        """
+        Writes the field into a batch of records, converting the whole column at once
+        when no value is omitted.
+        """
+        if not any(self.omits(v) for v in attr_values):
+            try:
+                for json_data, json_value in zip(json_list, self._adapter.dump_list(attr_values)):
+                    json_data[self._name] = json_value
+                return
+            except (TypeError, ValueError):
+                pass  # find out which records fail
+        for i, (json_data, attr_value) in enumerate(zip(json_list, attr_values)):
+            try:
+                self.write(json_data, attr_value)
+            except (TypeError, ValueError) as e:
+                on_error(i, e)
+
+    def read_raw(self, json_data: dict):
+        """
+        Like read_present(), but returns the JSON value without converting it.
+        """
+        json_value = json_data.get(self._name, _MISSING)
+        if json_value is _MISSING:
+            if self._required:
+                raise ValueError(f'Required field {self._name} is missing.')
+            return _MISSING
+        if json_value is None and self._allow_null:
+            return _MISSING
+        return json_value
 
     def write(self, json_data: dict, attr_value: Any):
-        if self._adapter.is_empty(attr_value) and self._omit_empty:
+        if self.omits(attr_value):
             return
         json_data[self._name] = self._adapter.dump(attr_value)
 
+    def omits(self, attr_value: Any) -> bool:
+        return self._omit_empty and self._adapter.is_empty(attr_value)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def adapter(self) -> Adapter:
+        return self._adapter
+
+    def clone(self, attr_value: Any):
+        return self._adapter.clone(attr_value)
+
+    def is_immutable(self) -> bool:
+        return self._adapter.is_immutable()
+
     def zero(self):
         return self._adapter.zero()
 
 
-def _maybe_setattr(cls, attr_name, attr_value):
-    if not hasattr(cls, attr_name):
-        setattr(cls, attr_name, attr_value)
+class _LazyDefault:
+    """
+    Class-level default for fields whose zero value is mutable (lists, dicts, objects).
+    A fresh zero value is stored in the instance on first access, so instances never share it.
+    Concurrent first reads all return the value that was stored first.
+    """
 
+    def __init__(self, attr_name: str, handler: FieldHandler):
+        self._attr_name = attr_name
+        self._handler = handler
 
-def _update_attr(cls, attr_name, attr_value):
-    if hasattr(cls, attr_name):
-        f = dict(getattr(cls, attr_name))
-        f.update(attr_value)
-        setattr(cls, attr_name, f)
-    else:
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        return obj.__dict__.setdefault(self._attr_name, self._handler.zero())
+
+
+def _field_value(obj, attr_name: str, field: FieldHandler):
+    # Reads a field for serialization without touching the instance:
+    # unlike getattr(), an unset field does not get a copy of its default stored.
+    v = obj.__dict__.get(attr_name, _MISSING)
+    if v is _MISSING:
+        return field.zero()
+    return v
+
+
+def _set_defaults(cls, fields: Dict[str, FieldHandler]):
+    # Immutable zero values live on the class and are shared by all instances,
+    # so that constructors only need to write the attributes that were actually given.
+    for attr_name, handler in fields.items():
+        zero = handler.zero()
+        if is_atomic(zero) or isinstance(zero, datetime):
+            setattr(cls, attr_name, zero)
+        else:
+            setattr(cls, attr_name, _LazyDefault(attr_name, handler))
+
+
+def _maybe_setattr(cls, attr_name, attr_value):
+    if not hasattr(cls, attr_name):
         setattr(cls, attr_name, attr_value)
 
 
 def _init_obj(obj, **kwargs):
     fields: dict = getattr(obj.__class__, _FIELDS)
-    for attr_name, attr_value in fields.items():
-        if attr_name in kwargs:
-            setattr(obj, attr_name, kwargs[attr_name])
-        else:
-            setattr(obj, attr_name, attr_value.zero())
-    for k in kwargs.keys():
+    obj_dict = obj.__dict__
+    for k, v in kwargs.items():
         if k not in fields:
             raise ValueError(f'No matching JSON Field for the initializer `{k}`')
+        obj_dict[k] = v
+
+
+def _frozen_setattr(obj, name, value):
+    raise AttributeError(f'Cannot assign to field `{name}` of frozen {obj.__class__.__name__}')
+
+
+def _frozen_delattr(obj, name):
+    raise AttributeError(f'Cannot delete field `{name}` of frozen {obj.__class__.__name__}')
+
+
+def _new_obj(cls):
+    """
+    Creates an instance without running __init__.
+    Fields that are not written afterwards fall back to the class-level defaults.
+    """
+    return cls.__new__(cls)
 
 
 class Jsonier:
@@ -136,15 +311,21 @@ class Jsonier:
     Wrapper class that generates all necessary plumbing around JSON conversion.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: Optional[int] = None, cache_ttl: Optional[float] = None):
+        """
+        :param cache_size: default size of the parse cache of each class, None or 0 to disable caching
+        :param cache_ttl: default lifetime of parse cache entries in seconds, None for no expiry
+        """
         self._typespec_parser = TypeSpecParser()
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
 
     def typespec_parser(self):
         return self._typespec_parser
 
-    def __call__(self, cls, /, *args, **kwargs):
+    def __call__(self, cls=None, /, **options):
         def wrap(c):
-            return self._process_class(c)
+            return self._process_class(c, **options)
 
         # See if we're being called as @dataclass or @dataclass().
         if cls is None:
@@ -152,24 +333,57 @@ class Jsonier:
             return wrap
 
         # We're called as @dataclass without parens.
-        return self._process_class(cls)
-
-    def _process_class(self, cls):
+        return self._process_class(cls, **options)
+
+    def _process_class(self,
+                       cls,
+                       frozen: bool = False,
+                       cache_size: Optional[int] = None,
+                       cache_ttl: Optional[float] = None):
+        with _class_lock:
+            return self._process_class_locked(cls, frozen, cache_size, cache_ttl)
+
+    def _process_class_locked(self,
+                              cls,
+                              frozen: bool,
+                              cache_size: Optional[int],
+                              cache_ttl: Optional[float]):
         fields = self._create_fields(cls)
+        all_fields = dict(getattr(cls, _FIELDS, {}))  # fields inherited from jsonified base classes
+        all_fields.update(fields)
 
-        if hasattr(cls, _FIELDS):
-            f = dict(getattr(cls, _FIELDS))
-            f.update(fields)
-            setattr(cls, _FIELDS, f)
-        else:
-            setattr(cls, _FIELDS, fields)
+        _set_defaults(cls, fields)
+        setattr(cls, _CANONICAL, _canonical_order(all_fields))
+
+        if cache_size is None:
+            cache_size = self._cache_size
+        if cache_ttl is None:
+            cache_ttl = self._cache_ttl
+        if cache_size:
+            setattr(cls, _CACHE, ParseCache(maxsize=cache_size, ttl=cache_ttl))
+
+        if frozen:
+            setattr(cls, _FROZEN, True)
+            setattr(cls, '__setattr__', _frozen_setattr)
+            setattr(cls, '__delattr__', _frozen_delattr)
+        setattr(cls, _SHAREABLE, is_frozen(cls) and all(f.is_immutable() for f in all_fields.values()))
 
         _maybe_setattr(cls, 'load', MethodType(load, cls))
         _maybe_setattr(cls, 'loads', MethodType(loads, cls))
+        _maybe_setattr(cls, 'loadb', MethodType(loadb, cls))
+        _maybe_setattr(cls, 'load_many', MethodType(load_many, cls))
+        _maybe_setattr(cls, 'dump_many', MethodType(dump_many, cls))
+        _maybe_setattr(cls, 'scan', MethodType(scan, cls))
+        _maybe_setattr(cls, 'dump_lines', MethodType(dump_lines, cls))
+        _maybe_setattr(cls, 'extract', MethodType(extract, cls))
         _maybe_setattr(cls, 'dump', dump)
         _maybe_setattr(cls, 'dumps', dumps)
+        _maybe_setattr(cls, 'clone', clone)
+        _maybe_setattr(cls, 'fingerprint', fingerprint)
         setattr(cls, '__repr__', _to_repr)
         setattr(cls, '__init__', _init_obj)
+        # set last, so that other threads never see a half-processed class as jsonified
+        setattr(cls, _FIELDS, all_fields)
         return cls
 
     def _create_fields(self, cls) -> Dict[str, FieldHandler]:
@@ -199,28 +413,350 @@ class Jsonier:
 def load(cls, json_data: dict):
     require_jsonified(cls)
     fields: dict = getattr(cls, _FIELDS)
-    inst = cls()
-    for attr_name, field in fields.items():
+    return _load_fields(cls, fields.items(), json_data)
+
+
+def _load_fields(cls, fields: Iterable[Tuple[str, FieldHandler]], json_data: dict):
+    inst = _new_obj(cls)
+    obj_dict = inst.__dict__
+    for attr_name, field in fields:
         try:
-            v = field.read(json_data=json_data)
+            v = field.read_present(json_data=json_data)
         except (TypeError, ValueError) as e:
             message = str(e)
             raise e.__class__(f'Error parsing {attr_name}: {message}')
-        setattr(inst, attr_name, v)
+        if v is not _MISSING:
+            obj_dict[attr_name] = v
     return inst
 
 
+class _ErrorCollector:
+    """
+    Records errors of a batch, keeping the first error of each record.
+    Unless errors are collected, result() raises the error of the first bad record. Batches are
+    converted column by column, so the error of a later record can be found first.
+    """
+
+    def __init__(self, errors: str):
+        if errors not in ('raise', 'collect'):
+            raise ValueError(f'errors must be `raise` or `collect`, got `{errors}`')
+        self._raise = errors == 'raise'
+        self.errors = {}  # index -> error
+
+    def field_error(self, attr_name: str) -> Callable[[int, Exception], None]:
+        def on_error(i: int, e: Exception):
+            self.add(i, e.__class__(f'Error parsing {attr_name}: {e}'))
+
+        return on_error
+
+    def add(self, i: int, e: Exception):
+        self.errors.setdefault(i, e)
+
+    def result(self, items: list) -> Union[list, BatchResult]:
+        errors = self.errors
+        if self._raise:
+            if errors:
+                i = min(errors)
+                raise errors[i].__class__(f'Item {i}: {errors[i]}')
+            return items
+        return BatchResult(items=[item for i, item in enumerate(items) if i not in errors],
+                           errors=[BatchError(i, errors[i]) for i in sorted(errors)])
+
+
+def load_many(cls,
+              json_list: List[dict],
+              errors: str = 'raise',
+              executor: Optional[Executor] = None,
+              chunk_size: int = 256) -> Union[list, BatchResult]:
+    """
+    Loads a batch of records, converting field by field rather than record by record.
+    :param errors: 'raise' to stop at the first bad record, or 'collect' to skip bad records
+    :param executor: if given, chunks of the batch are loaded in parallel on it, e.g. a ThreadPoolExecutor
+    :param chunk_size: number of records per chunk when an executor is used
+    :return: list of objects, or with errors='collect', a BatchResult with the objects that loaded
+             and a BatchError(index, error) for each record that did not
+    """
+    require_jsonified(cls)
+    collector = _ErrorCollector(errors)
+    if executor is not None:
+        return _run_in_chunks(executor, _load_batch, cls, json_list, chunk_size, collector)
+    return collector.result(_load_batch(cls, json_list, collector))
+
+
+def _load_batch(cls, json_list: List[dict], collector: _ErrorCollector) -> list:
+    fields: dict = getattr(cls, _FIELDS)
+    for i, json_data in enumerate(json_list):
+        if not isinstance(json_data, dict):
+            collector.add(i, TypeError(f'Expecting a dict, got {type_name(json_data)} instead'))
+    if collector.errors:
+        json_list = [d if isinstance(d, dict) else {} for d in json_list]
+
+    insts = [_new_obj(cls) for _ in json_list]
+    obj_dicts = [inst.__dict__ for inst in insts]
+    for attr_name, field in fields.items():
+        values = field.read_column(json_list, collector.field_error(attr_name))
+        for obj_dict, v in zip(obj_dicts, values):
+            if v is not _MISSING:
+                obj_dict[attr_name] = v
+    return insts
+
+
+def dump_many(cls,
+              objs: list,
+              errors: str = 'raise',
+              executor: Optional[Executor] = None,
+              chunk_size: int = 256) -> Union[list, BatchResult]:
+    """
+    Dumps a batch of objects of cls, converting field by field rather than object by object.
+    :param errors: 'raise' to stop at the first bad object, or 'collect' to skip bad objects
+    :param executor: if given, chunks of the batch are dumped in parallel on it, e.g. a ThreadPoolExecutor
+    :param chunk_size: number of objects per chunk when an executor is used
+    :return: list of JSON dicts, or with errors='collect', a BatchResult with the dicts of the objects
+             that could be converted and a BatchError(index, error) for each object that could not
+    """
+    require_jsonified(cls)
+    collector = _ErrorCollector(errors)
+    if executor is not None:
+        return _run_in_chunks(executor, _dump_batch, cls, objs, chunk_size, collector)
+    return collector.result(_dump_batch(cls, objs, collector))
+
+
+def _dump_batch(cls, objs: list, collector: _ErrorCollector) -> list:
+    fields: dict = getattr(cls, _FIELDS)
+    json_list = [None] * len(objs)
+    batch = []  # indices of the objects of exactly cls, which are converted column by column
+    for i, obj in enumerate(objs):
+        if type(obj) is cls:
+            batch.append(i)
+        elif isinstance(obj, cls):
+            # subclasses can have fields of their own
+            try:
+                json_list[i] = dump(obj)
+            except (TypeError, ValueError) as e:
+                collector.add(i, e)
+        else:
+            collector.add(i, TypeError(f'Expecting a {cls.__name__}, got {type_name(obj)} instead'))
+
+    columns = [{} for _ in batch]
+    for attr_name, field in fields.items():
+        attr_values = [_field_value(objs[i], attr_name, field) for i in batch]
+        on_error = collector.field_error(attr_name)
+        field.write_column(columns, attr_values, lambda j, e: on_error(batch[j], e))
+    for i, json_data in zip(batch, columns):
+        json_list[i] = json_data
+    return json_list
+
+
+def _convert_chunk(convert: Callable, cls, chunk: list) -> Tuple[list, dict]:
+    collector = _ErrorCollector('collect')
+    return convert(cls, chunk, collector), collector.errors
+
+
+def _run_in_chunks(executor: Executor,
+                   convert: Callable,
+                   cls,
+                   items: list,
+                   chunk_size: int,
+                   collector: _ErrorCollector) -> Union[list, BatchResult]:
+    if chunk_size <= 0:
+        raise ValueError(f'Chunk size must be positive, got {chunk_size}')
+    starts = range(0, len(items), chunk_size)
+    futures = [executor.submit(_convert_chunk, convert, cls, items[start:start + chunk_size]) for start in starts]
+    results = []
+    for start, future in zip(starts, futures):
+        values, errors = future.result()
+        for i in sorted(errors):
+            collector.add(start + i, errors[i])
+        results.extend(values)
+    return collector.result(results)
+
+
 def loads(cls, json_str: str):
+    cache = parse_cache(cls)
+    if cache is not None:
+        return _cached_load(cls, cache, json_str)
     return load(cls, json_data=json.loads(json_str))
 
 
+def loadb(cls, json_bytes: bytes):
+    cache = parse_cache(cls)
+    if cache is not None:
+        return _cached_load(cls, cache, json_bytes)
+    return load(cls, json_data=json.loads(json_bytes))
+
+
+def _cached_load(cls, cache: ParseCache, raw: Union[str, bytes]):
+    key = payload_key(raw)
+    inst = cache.get(key, _MISSING)
+    if inst is _MISSING:
+        inst = load(cls, json_data=json.loads(raw))
+        cache.put(key, inst)
+    if is_shareable(cls):
+        return inst
+    # other instances are handed out as copies, so that callers cannot modify the cached one,
+    # including the lists and dicts of frozen instances
+    return clone(inst)
+
+
+class _RecordView(Mapping):
+    """
+    Read-only view of a decoded JSON record that is indexed by attribute names instead of JSON keys.
+    Values are the raw JSON values, before any conversion.
+    """
+
+    def __init__(self, keys: Dict[str, str]):
+        self._keys = keys  # attribute name -> JSON key
+        self._data = {}
+
+    def __getitem__(self, attr_name: str):
+        return self._data[self._keys[attr_name]]
+
+    def __iter__(self) -> Iterator[str]:
+        return (attr_name for attr_name, key in self._keys.items() if key in self._data)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def scan(cls,
+         source: Source,
+         where: Optional[Callable[[Mapping], bool]] = None,
+         fields: Optional[List[str]] = None) -> Iterator:
+    """
+    Reads newline-delimited JSON records and yields them as instances of cls.
+    gzip, bz2 and xz files are decompressed in a background thread while records are converted.
+    :param source: file name, file object or any iterable of lines
+    :param where: predicate that is called with a mapping from field names to the raw JSON values
+                  of each record, before the record is converted. Records it rejects are skipped.
+    :param fields: names of the fields to load, other fields keep their default values
+    """
+    require_jsonified(cls)
+    all_fields: dict = getattr(cls, _FIELDS)
+    if fields is None:
+        items = list(all_fields.items())
+    else:
+        for attr_name in fields:
+            if attr_name not in all_fields:
+                raise ValueError(f'No matching JSON Field for `{attr_name}`')
+        items = [(attr_name, all_fields[attr_name]) for attr_name in fields]
+    view = _RecordView({attr_name: field.name for attr_name, field in all_fields.items()})
+
+    with open_lines(source) as lines:
+        for line in lines:
+            if not line.strip():
+                continue
+            json_data = json.loads(line)
+            if not isinstance(json_data, dict):
+                raise TypeError(f'Expecting a dict, got {type(json_data).__name__} instead')
+            if where is not None:
+                view._data = json_data
+                if not where(view):
+                    continue
+            yield _load_fields(cls, items, json_data)
+
+
+def dump_lines(cls,
+               objs: Iterable,
+               target: Union[str, os.PathLike, BinaryIO],
+               compression: Optional[str] = 'auto',
+               **kwargs) -> int:
+    """
+    Writes objects as newline-delimited JSON.
+    Compressed output is compressed in a background thread while further objects are converted.
+    :param target: file name or binary file object
+    :param compression: 'gzip', 'bz2', 'xz', None, or 'auto' to choose by the file extension
+    :param kwargs: passed to json.dumps()
+    :return: number of objects written
+    """
+    require_jsonified(cls)
+    count = 0
+    with open_writer(target, compression=compression) as w:
+        for obj in objs:
+            w.write((json.dumps(dump(obj), **kwargs) + '\n').encode('utf-8'))
+            count += 1
+    return count
+
+
+class FieldPath:
+    """
+    Precompiled accessor for a dotted attribute path, such as 'meta.tenant_id'.
+    It reads the value straight from the decoded JSON, running only the adapter of the last field.
+    The result is the same as loading the whole object and following the attributes,
+    except that None is returned where the path runs through an object that is not set.
+    """
+
+    def __init__(self, cls, path: str):
+        from jsonier.adapter.object import ObjectAdapter
+
+        require_jsonified(cls)
+        self._path = path
+        self._steps = []  # (attribute name, field handler)
+        current = cls
+        for attr_name in path.split('.'):
+            if current is None:
+                raise ValueError(f'Cannot resolve `{path}`: `{self._steps[-1][0]}` is not an object field')
+            field = getattr(current, _FIELDS).get(attr_name)
+            if field is None:
+                raise ValueError(f'Cannot resolve `{path}`: {current.__name__} has no field `{attr_name}`')
+            self._steps.append((attr_name, field))
+            adapter = field.adapter
+            current = adapter.child_class() if isinstance(adapter, ObjectAdapter) else None
+
+    def get(self, raw: Union[str, bytes, dict]):
+        """
+        :param raw: JSON text or decoded JSON object
+        :return: the converted value at the end of the path
+        """
+        json_data = json.loads(raw) if isinstance(raw, (str, bytes, bytearray)) else raw
+        steps = self._steps
+        for i, (attr_name, field) in enumerate(steps):
+            if not isinstance(json_data, dict):
+                raise TypeError(f'Error parsing {self._path}: expecting a dict at `{attr_name}`, '
+                                f'got {type(json_data).__name__} instead')
+            try:
+                if i == len(steps) - 1:
+                    return field.read(json_data)
+                json_data = field.read_raw(json_data)
+            except (TypeError, ValueError) as e:
+                raise e.__class__(f'Error parsing {self._path}: {e}')
+            if json_data is _MISSING:
+                # the object is not in the JSON, continue from its default
+                return self._follow(field.zero(), i + 1)
+            if json_data is None:
+                return None
+
+    def _follow(self, obj, start: int):
+        for attr_name, _ in self._steps[start:]:
+            if obj is None:
+                return None
+            obj = getattr(obj, attr_name)
+        return obj
+
+    def __repr__(self):
+        return f'FieldPath({self._path!r})'
+
+
+@lru_cache(maxsize=1024)
+def compile_path(cls, path: str) -> FieldPath:
+    return FieldPath(cls, path)
+
+
+def extract(cls, raw: Union[str, bytes, dict], path: str):
+    """
+    Reads a single value from a JSON payload without loading the whole object.
+    :param raw: JSON text or decoded JSON object
+    :param path: dotted attribute path, such as 'meta.tenant_id'
+    """
+    return compile_path(cls, path).get(raw)
+
+
 def dump(obj) -> dict:
     cls = obj.__class__
     require_jsonified(cls)
     converters: dict = getattr(cls, _FIELDS)
     json_data = {}
     for attr_name, field in converters.items():
-        field.write(json_data=json_data, attr_value=getattr(obj, attr_name))
+        field.write(json_data=json_data, attr_value=_field_value(obj, attr_name, field))
     return json_data
 
 
@@ -228,7 +764,92 @@ def dumps(obj, **kwargs) -> str:
     return json.dumps(dump(obj), **kwargs)
 
 
+def clone(obj, deep: bool = True):
+    """
+    Copies a jsonified object.
+    A deep copy shares immutable values (numbers, strings, datetimes, frozen objects without lists
+    or dicts), copies lists and dicts and clones other nested jsonified objects. A shallow copy shares all field values.
+    """
+    cls = obj.__class__
+    require_jsonified(cls)
+    inst = _new_obj(cls)
+    src = obj.__dict__
+    dst = inst.__dict__
+    if not deep:
+        dst.update(src)
+        return inst
+    fields: dict = getattr(cls, _FIELDS)
+    for attr_name, attr_value in src.items():
+        field = fields.get(attr_name)
+        dst[attr_name] = attr_value if field is None else field.clone(attr_value)
+    return inst
+
+
+def _canonical_order(fields: Dict[str, FieldHandler]) -> list:
+    # (encoded JSON key, attribute name, field handler), sorted by key
+    entries = [(canonical_str(field.name) + b':', attr_name, field) for attr_name, field in fields.items()]
+    return sorted(entries, key=lambda e: e[0])
+
+
+def write_canonical(obj, out: Out):
+    """
+    Writes the canonical encoding of an object into out, piece by piece:
+    keys are sorted, timestamps and floats are normalized and empty fields are left out as in dump().
+    """
+    out(b'{')
+    sep = b''
+    for key, attr_name, field in getattr(obj.__class__, _CANONICAL):
+        attr_value = _field_value(obj, attr_name, field)
+        if field.omits(attr_value):
+            continue
+        out(sep)
+        out(key)
+        field.adapter.write_canonical(out, attr_value)
+        sep = b','
+    out(b'}')
+
+
+def canonical(obj) -> bytes:
+    require_jsonified(obj.__class__)
+    chunks = []
+    write_canonical(obj, chunks.append)
+    return b''.join(chunks)
+
+
+# Fingerprints remembered for shareable instances: id(obj) -> {algorithm: digest}. They are kept
+# outside the instances, so that they are neither attributes nor copied by clone().
+_fingerprints: Dict[int, Dict[str, str]] = {}
+
+
+def fingerprint(obj, algorithm: str = 'sha256') -> str:
+    """
+    Hashes the canonical encoding of an object, without building the JSON dict or string.
+    Frozen objects that hold only immutable values remember their fingerprints.
+    :param algorithm: any algorithm supported by hashlib.new()
+    :return: hex digest
+    """
+    cls = obj.__class__
+    require_jsonified(cls)
+    frozen = is_shareable(cls)  # lists and dicts of other frozen objects can still change
+    if frozen:
+        digest = _fingerprints.get(id(obj), {}).get(algorithm)
+        if digest is not None:
+            return digest
+    h = hashlib.new(algorithm)
+    write_canonical(obj, h.update)
+    digest = h.hexdigest()
+    if frozen:
+        digests = _fingerprints.get(id(obj))
+        if digests is None:
+            digests = _fingerprints.setdefault(id(obj), {})
+            # forget the digests when obj goes away, before its id can be reused
+            weakref.finalize(obj, _fingerprints.pop, id(obj), None)
+        digests[algorithm] = digest
+    return digest
+
+
 def _to_repr(obj):
     name = obj.__class__.__name__
-    args = [f'{k}={repr(v)}' for k, v in vars(obj).items()]
+    fields: dict = getattr(obj.__class__, _FIELDS)
+    args = [f'{k}={repr(_field_value(obj, k, field))}' for k, field in fields.items()]
     return name + '(' + ','.join(args) + ')'
@@ -0,0 +1,45 @@
+import sys
+from typing import Any, Optional, Set
+
+from jsonier.adapter.map_of import LazyMap
+from jsonier.marshalling import _FIELDS, is_jsonified
+
+
+def deep_sizeof(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Approximate deep size of a value in bytes.
+    Jsonified instances are walked through their fields, lists and dicts through their items.
+    Lazy maps count both their raw JSON values and the values converted so far.
+    Objects reachable more than once are counted once. Fields that were never set are not counted,
+    since their defaults live on the class.
+    :param obj: value to measure
+    :param seen: ids of objects that have already been counted
+    :return: size in bytes
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    cls = obj.__class__
+    if is_jsonified(cls):
+        obj_dict = getattr(obj, '__dict__', None)
+        if obj_dict is not None and id(obj_dict) not in seen:
+            seen.add(id(obj_dict))
+            size += sys.getsizeof(obj_dict)
+        fields: dict = getattr(cls, _FIELDS)
+        for attr_name, attr_value in (obj_dict or {}).items():
+            if attr_name in fields:
+                size += deep_sizeof(attr_value, seen)
+    elif isinstance(obj, LazyMap):
+        size += deep_sizeof(obj._raw, seen)
+        size += deep_sizeof(obj._converted, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += deep_sizeof(item, seen)
+    elif isinstance(obj, dict):
+        for k, v in obj.items():
+            size += deep_sizeof(k, seen)
+            size += deep_sizeof(v, seen)
+    return size
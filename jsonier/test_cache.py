@@ -0,0 +1,143 @@
+import unittest
+
+from jsonier import *
+from jsonier.adapter import Adapter
+from jsonier.cache import ParseCache
+from jsonier.marshalling import is_shareable
+
+
+@jsonified(cache_size=2)
+class Config:
+    name = Field(str)
+    values = Field(ListOf[int])
+
+
+@jsonified(frozen=True, cache_size=4)
+class FrozenConfig:
+    name = Field(str)
+
+
+@jsonified(frozen=True, cache_size=4)
+class FrozenList:
+    name = Field(str)
+    values = Field(ListOf[int])
+    config = Field(FrozenConfig)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestParseCache(unittest.TestCase):
+    def test_lru(self):
+        cache = ParseCache(maxsize=2)
+        cache.put(b'a', 1)
+        cache.put(b'b', 2)
+        self.assertEqual(cache.get(b'a'), 1)
+        cache.put(b'c', 3)  # evicts b, the least recently used
+        self.assertIsNone(cache.get(b'b'))
+        self.assertEqual(cache.get(b'c'), 3)
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.currsize), (2, 1, 1, 2))
+
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = ParseCache(maxsize=2, ttl=10, clock=clock)
+        cache.put(b'a', 1)
+        clock.now = 9.0
+        self.assertEqual(cache.get(b'a'), 1)
+        clock.now = 10.0
+        self.assertIsNone(cache.get(b'a'))
+        self.assertEqual(cache.info().currsize, 0)
+
+
+class TestCachedLoads(unittest.TestCase):
+    def setUp(self):
+        parse_cache(Config).clear()
+        parse_cache(FrozenConfig).clear()
+        parse_cache(FrozenList).clear()
+
+    def test_mutable_copies(self):
+        payload = '{"name": "a", "values": [1, 2]}'
+        c1 = Config.loads(payload)
+        c1.values.append(3)
+        c2 = Config.loadb(payload.encode())
+        self.assertIsNot(c1, c2)
+        self.assertEqual(c2.values, [1, 2])
+        info = parse_cache(Config).info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_frozen_shared(self):
+        f1 = FrozenConfig.loads('{"name": "a"}')
+        f2 = FrozenConfig.loads('{"name": "a"}')
+        self.assertIs(f1, f2)
+        with self.assertRaises(AttributeError):
+            f1.name = 'b'
+        self.assertEqual(FrozenConfig(name='c').name, 'c')
+
+    def test_frozen_with_lists_copied(self):
+        payload = '{"name": "a", "values": [1], "config": {"name": "b"}}'
+        f1 = FrozenList.loads(payload)
+        f1.values.append(2)
+        f2 = FrozenList.loads(payload)
+        self.assertIsNot(f1, f2)
+        self.assertEqual(f2.values, [1])
+        self.assertIs(f1.config, f2.config)  # nested frozen objects without lists are shared
+        self.assertFalse(is_shareable(FrozenList))
+        self.assertTrue(is_shareable(FrozenConfig))
+
+    def test_disabled(self):
+        self.assertIsNone(parse_cache(Person))
+
+
+@jsonified
+class Person:
+    name = Field(str)
+
+
+class SetAdapter(Adapter):
+    def load(self, json_data):
+        return set(json_data)
+
+    def dump(self, obj):
+        return sorted(obj)
+
+
+class TestJsonierDefaults(unittest.TestCase):
+    def test_instance_settings(self):
+        j = Jsonier(cache_size=8, cache_ttl=60)
+        register_handlers(j)
+
+        @j
+        class A:
+            x = Field(int)
+
+        @j(cache_size=0)
+        class B:
+            x = Field(int)
+
+        self.assertEqual(parse_cache(A).info().maxsize, 8)
+        self.assertIsNone(parse_cache(B))
+
+    def test_custom_adapter_not_shared(self):
+        j = Jsonier(cache_size=8)
+        register_handlers(j)
+        j.typespec_parser().register(set, SetAdapter)
+
+        @j(frozen=True)
+        class Tags:
+            tags = Field(set)
+
+        self.assertFalse(is_shareable(Tags))
+        t1 = Tags.loads('{"tags": ["a"]}')
+        t1.tags.add('b')
+        self.assertEqual(Tags.loads('{"tags": ["a"]}').tags, {'a'})
+        self.assertIsNot(t1.clone().tags, t1.tags)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import (
     datetime,
     timezone,
@@ -6,6 +8,12 @@ from datetime import (
 )
 
 from jsonier import *
+from jsonier import marshalling
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 @jsonified
@@ -165,5 +173,612 @@ class TestTimestamp(unittest.TestCase):
         self.assertIsNone(bd.valid_until)
 
 
+@jsonified
+class Click:
+    x = Field(int)
+    y = Field(int)
+
+
+@jsonified
+class KeyPress:
+    key = Field(str, required=True)
+
+
+@jsonified
+class Session:
+    events = Field(ListOf[OneOf[Click, ('key', KeyPress)]])
+    last = Field(OneOf[Click, ('key', KeyPress)], discriminator='kind')
+
+
+class TestOneOf(unittest.TestCase):
+    def test_load(self):
+        data = """
+        {
+           "events": [
+              {"type": "Click", "x": 1, "y": 2},
+              {"type": "key", "key": "q"}
+           ],
+           "last": {"kind": "key", "key": "z"}
+        }
+        """
+        s = Session.loads(data)
+        self.assertIsInstance(s.events[0], Click)
+        self.assertEqual(s.events[0].y, 2)
+        self.assertIsInstance(s.events[1], KeyPress)
+        self.assertEqual(s.events[1].key, 'q')
+        self.assertEqual(s.last.key, 'z')
+
+    def test_dump(self):
+        s = Session(events=[KeyPress(key='a'), Click(x=3)], last=Click(y=4))
+        j = s.dump()
+        self.assertEqual(j['events'], [{'type': 'key', 'key': 'a'}, {'type': 'Click', 'x': 3}])
+        self.assertEqual(j['last'], {'kind': 'Click', 'y': 4})
+
+    def test_unknown_tag(self):
+        with self.assertRaises(ValueError):
+            Session.loads('{"events": [{"type": "Scroll"}]}')
+        with self.assertRaises(ValueError):
+            Session.loads('{"events": [{"x": 1}]}')
+        with self.assertRaises(TypeError):
+            Session(last=Session()).dump()
+
+    def test_single_tagged_choice(self):
+        @jsonified
+        class Keys:
+            last = Field(OneOf[('key', KeyPress)])
+
+        k = Keys.load({'last': {'type': 'key', 'key': 'q'}})
+        self.assertEqual(k.last.key, 'q')
+        self.assertEqual(k.dump(), {'last': {'type': 'key', 'key': 'q'}})
+
+    def test_discriminator_collision(self):
+        @jsonified
+        class Typed:
+            type = Field(str)
+
+        with self.assertRaises(TypeError):
+            @jsonified
+            class Holder:
+                event = Field(OneOf[Typed])
+
+        @jsonified
+        class Holder:
+            event = Field(OneOf[Typed], discriminator='kind')
+
+        h = Holder.load(Holder(event=Typed(type='t')).dump())
+        self.assertEqual(h.event.type, 't')
+
+        @jsonified
+        class Log:
+            events = Field(ListOf[OneOf[Typed]], discriminator='kind')
+
+        self.assertEqual(Log(events=[Typed(type='t')]).dump(), {'events': [{'kind': 'Typed', 'type': 't'}]})
+
+
+class TestDeepSizeof(unittest.TestCase):
+    def test_nested(self):
+        address = Address(street='1 Main st', city='Springfield', state='XX')
+        bare = deep_sizeof(Person2(first='A'))
+        full = deep_sizeof(Person2(first='A', address=address))
+        self.assertGreater(full, bare + deep_sizeof(address.street))
+
+    def test_shared(self):
+        contact = Contact(kind='phone', data='555')
+        p = Person(contacts={'home': contact, 'work': contact})
+        self.assertLess(deep_sizeof(p), deep_sizeof(Person(contacts={'home': contact})) + deep_sizeof(contact))
+
+
+@jsonified
+class Defaults:
+    count = Field(int, default=5)
+    tags = Field(ListOf[str], default=['a'])
+    extra = Field(MapOf[int], default={'x': 1})
+
+
+class TestConstruction(unittest.TestCase):
+    def test_defaults(self):
+        d = Defaults()
+        self.assertEqual(d.count, 5)
+        self.assertEqual(d.tags, ['a'])
+        self.assertEqual(d.extra, {'x': 1})
+        self.assertEqual(repr(d), "Defaults(count=5,tags=['a'],extra={'x': 1})")
+
+    def test_mutable_defaults_not_shared(self):
+        d1 = Defaults()
+        d2 = Defaults.load({})
+        d1.tags.append('b')
+        d1.extra['y'] = 2
+        self.assertEqual(d2.tags, ['a'])
+        self.assertEqual(d2.extra, {'x': 1})
+        self.assertEqual(Defaults().tags, ['a'])
+
+    def test_reading_does_not_store_defaults(self):
+        d = Defaults()
+        d.dump()
+        d.dumps()
+        Defaults.dump_many([d])
+        d.fingerprint()
+        repr(d)
+        deep_sizeof(d)
+        self.assertEqual(vars(d), {})
+
+    def test_load_writes_given_fields_only(self):
+        d = Defaults.load({'count': 7})
+        self.assertEqual(vars(d), {'count': 7})
+        self.assertEqual(d.dump(), {'count': 7, 'tags': ['a'], 'extra': {'x': 1}})
+
+
+class TestClone(unittest.TestCase):
+    def setUp(self):
+        self.p = Person(name='Ann',
+                        birthday=datetime(2000, 1, 2),
+                        hobbies=['chess'],
+                        address=Address(city='X', state='Y'),
+                        contacts={'home': Contact(kind='phone', data='1')})
+
+    def test_deep(self):
+        q = self.p.clone()
+        self.assertEqual(q.dump(), self.p.dump())
+        self.assertIs(q.birthday, self.p.birthday)
+        self.assertIsNot(q.hobbies, self.p.hobbies)
+        self.assertIsNot(q.address, self.p.address)
+        self.assertIsNot(q.contacts['home'], self.p.contacts['home'])
+        q.hobbies.append('go')
+        q.contacts['home'].data = '2'
+        self.assertEqual(self.p.hobbies, ['chess'])
+        self.assertEqual(self.p.contacts['home'].data, '1')
+
+    def test_shallow(self):
+        q = self.p.clone(deep=False)
+        self.assertIs(q.hobbies, self.p.hobbies)
+        self.assertIs(q.address, self.p.address)
+
+
+@jsonified
+class Series:
+    ints = Field(ListOf[Timestamp[int]])
+    floats = Field(ListOf[Timestamp[float]])
+    strs = Field(ListOf[Timestamp[str]])
+
+
+class TestTimestampList(unittest.TestCase):
+    def test_bulk(self):
+        s = Series.load({'ints': [0, 86400], 'floats': [1.5], 'strs': ['2020-01-02T03:04:05Z']})
+        self.assertEqual(s.ints, [datetime(1970, 1, 1), datetime(1970, 1, 2)])
+        self.assertEqual(s.floats, [datetime(1970, 1, 1, 0, 0, 1, 500000)])
+        self.assertEqual(s.strs, [datetime(2020, 1, 2, 3, 4, 5)])
+        self.assertEqual(s.dump()['strs'], ['2020-01-02T03:04:05Z'])
+
+    def test_nulls(self):
+        s = Series.load({'ints': [0, None], 'strs': [None, '2020-01-02T03:04:05']})
+        self.assertEqual(s.ints, [datetime(1970, 1, 1), None])
+        self.assertEqual(s.strs, [None, datetime(2020, 1, 2, 3, 4, 5)])
+        self.assertEqual(s.dump()['strs'], [None, '2020-01-02T03:04:05Z'])
+
+    def test_array_unsupported(self):
+        with self.assertRaises(TypeError):
+            @jsonified
+            class Names:
+                names = Field(ListOf[str], numpy=True)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_array(self):
+        @jsonified
+        class ArraySeries:
+            ints = Field(ListOf[Timestamp[int]], numpy=True)
+            floats = Field(ListOf[Timestamp[float]], numpy=True)
+
+        json_data = {'ints': [0, 86400], 'floats': [1.5]}
+        s = ArraySeries.load(json_data)
+        self.assertEqual(s.ints.dtype, numpy.dtype('datetime64[s]'))
+        self.assertEqual(s.ints[1], numpy.datetime64('1970-01-02T00:00:00'))
+        self.assertEqual(s.floats[0], numpy.datetime64('1970-01-01T00:00:01.500000'))
+        self.assertEqual(s.dump(), json_data)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_array_default(self):
+        @jsonified
+        class ArrayDefaults:
+            floats = Field(ListOf[Timestamp[float]], numpy=True, default=[1.5])
+            ints = Field(ListOf[Timestamp[int]], numpy=True, default=[datetime(1970, 1, 2, tzinfo=timezone.utc)],
+                         omit_empty=False)
+
+        s = ArrayDefaults()
+        self.assertIsInstance(s.floats, numpy.ndarray)
+        self.assertEqual(s.dump(), {'floats': [1.5], 'ints': [86400]})
+        s.floats[0] = numpy.datetime64(0, 'us')
+        self.assertEqual(ArrayDefaults.load({}).floats[0], numpy.datetime64('1970-01-01T00:00:01.500000'))
+
+
+class TestExtract(unittest.TestCase):
+    data = """
+    {
+       "name": "John",
+       "last-name": "Smith",
+       "address": {"street": "1 Main st", "city": "New Fork", "state": "NF"},
+       "contacts": {"home": {"kind": "phone", "data": "123"}}
+    }
+    """
+
+    def test_extract(self):
+        self.assertEqual(Person.extract(self.data, 'last_name'), 'Smith')
+        self.assertEqual(Person.extract(self.data, 'address.city'), 'New Fork')
+        self.assertEqual(Person.extract(self.data, 'address.street2'), '')
+        self.assertEqual(Person.extract(self.data, 'age'), 33)
+        self.assertIsNone(Person.extract(self.data, 'position.name'))
+
+    def test_no_nested_load(self):
+        # the invalid `level` is never converted
+        data = {"position": {"name": "boss", "level": "top"}}
+        self.assertEqual(Person.extract(data, 'position.name'), 'boss')
+        with self.assertRaises(ValueError):
+            Person.extract(data, 'position.level')
+
+    def test_compiled(self):
+        path = compile_path(Person, 'address.state')
+        self.assertIs(path, compile_path(Person, 'address.state'))
+        self.assertEqual(path.get(self.data), 'NF')
+        self.assertEqual(path.get({"address": {"state": "XX"}}), 'XX')
+
+    def test_invalid_path(self):
+        with self.assertRaises(ValueError):
+            compile_path(Person, 'address.zip')
+        with self.assertRaises(ValueError):
+            compile_path(Person, 'name.first')
+
+
+@jsonified
+class Directory:
+    contacts = Field(MapOf[Contact], lazy=True)
+
+
+class TestLazyMap(unittest.TestCase):
+    def setUp(self):
+        self.json_data = {'contacts': {'a': {'kind': 'phone', 'data': '1'},
+                                       'b': {'kind': 'fax', 'data': 'not converted'}}}
+
+    def test_access(self):
+        d = Directory.load(self.json_data)
+        self.assertEqual(len(d.contacts), 2)
+        self.assertIn('b', d.contacts)
+        a = d.contacts['a']
+        self.assertIsInstance(a, Contact)
+        self.assertIs(d.contacts['a'], a)
+        self.assertEqual(d.contacts.get('c'), None)
+        self.assertEqual(self.json_data['contacts']['a'], {'kind': 'phone', 'data': '1'})
+
+    def test_dump(self):
+        d = Directory.load(self.json_data)
+        d.contacts['a'].data = '2'
+        d.contacts['c'] = Contact(kind='email', data='x@y')
+        del d.contacts['b']
+        self.assertEqual(d.dump(), {'contacts': {'a': {'kind': 'phone', 'data': '2'},
+                                                 'c': {'kind': 'email', 'data': 'x@y'}}})
+        self.assertEqual(len(self.json_data['contacts']), 2)
+
+    def test_raw_passthrough(self):
+        d = Directory.load(self.json_data)
+        self.assertIs(d.dump()['contacts']['b'], self.json_data['contacts']['b'])
+
+    def test_clone(self):
+        d = Directory.load(self.json_data)
+        d.contacts['a'].data = '2'
+        c = d.clone()
+        c.contacts['a'].data = '3'
+        self.assertEqual(d.contacts['a'].data, '2')
+        self.assertEqual(c.contacts['b'].kind, 'fax')
+
+    def test_reads_do_not_copy(self):
+        d = Directory.load(self.json_data)
+        d.contacts['a']
+        self.assertIs(d.contacts._raw, self.json_data['contacts'])
+        d.contacts['c'] = Contact(kind='email', data='x@y')
+        self.assertIsNot(d.contacts._raw, self.json_data['contacts'])
+        self.assertIs(d.contacts['c'], d.contacts['c'])
+
+    def test_sizeof(self):
+        d = Directory.load(self.json_data)
+        raw = deep_sizeof(d)
+        self.assertGreater(raw, deep_sizeof(self.json_data['contacts']))
+        d.contacts['a']
+        self.assertGreater(deep_sizeof(d), raw)
+
+
+@jsonified(frozen=True)
+class Point:
+    x = Field(float)
+    y = Field(float)
+    at = Field(Timestamp[int])
+
+
+@jsonified(frozen=True)
+class FrozenTags:
+    tags = Field(ListOf[str])
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_canonical(self):
+        p = Person2(first='A', last='B', age=3, address=Address(city='C', state='D'))
+        self.assertEqual(canonical(p),
+                         b'{"address":{"city":"C","state":"D","street":""},'
+                         b'"age":3,"first-name":"A","surname":"B"}')
+
+    def test_key_order_independent(self):
+        p1 = Person.load({'name': 'A', 'last-name': 'B', 'contacts': {'x': {'kind': 'k', 'data': 'd'},
+                                                                      'y': {'kind': 'l', 'data': 'e'}}})
+        p2 = Person.load({'contacts': {'y': {'data': 'e', 'kind': 'l'}, 'x': {'data': 'd', 'kind': 'k'}},
+                          'last-name': 'B', 'name': 'A'})
+        self.assertEqual(p1.fingerprint(), p2.fingerprint())
+        p2.contacts['x'].data = 'f'
+        self.assertNotEqual(p1.fingerprint(), p2.fingerprint())
+
+    def test_normalized(self):
+        d1 = Dates(started=datetime(2002, 12, 25, 6, 0, tzinfo=timezone.utc))
+        d2 = Dates(started=datetime(2002, 12, 25, 0, 0, tzinfo=timezone(timedelta(hours=-6))))
+        self.assertEqual(d1.fingerprint(), d2.fingerprint())
+        self.assertEqual(Point(x=1.0, y=-0.0).fingerprint(), Point(x=1, y=0).fingerprint())
+
+    def test_algorithm(self):
+        p = Point(x=1.5)
+        self.assertEqual(len(p.fingerprint()), 64)
+        self.assertEqual(len(p.fingerprint('md5')), 32)
+
+    def test_frozen_cached(self):
+        p = Point(x=1.5, at=datetime(2020, 1, 1))
+        self.assertIs(p.fingerprint(), p.fingerprint())
+        self.assertEqual(p.fingerprint(), Point(x=1.5, at=datetime(2020, 1, 1)).fingerprint())
+        self.assertEqual(repr(p), 'Point(x=1.5,y=0.0,at=datetime.datetime(2020, 1, 1, 0, 0))')
+
+    def test_cache_not_in_instance(self):
+        p = Point(x=2.5)
+        digest = p.fingerprint()
+        self.assertEqual(vars(p), {'x': 2.5})
+        c = p.clone()
+        self.assertEqual(vars(c), {'x': 2.5})
+        self.assertEqual(c.fingerprint(), digest)
+        key = id(p)
+        del p
+        self.assertNotIn(key, marshalling._fingerprints)
+
+    def test_frozen_with_lists_not_cached(self):
+        f = FrozenTags.load({'tags': ['a']})
+        before = f.fingerprint()
+        f.tags.append('b')
+        self.assertNotEqual(f.fingerprint(), before)
+
+
+class MyStr(str):
+    pass
+
+
+@jsonified
+class Record:
+    id = Field(Union[int, str])
+    owner = Field(Union[Address, ListOf[str]])
+    when = Field(Union[Timestamp[int], str])
+    extra = Field(Any)
+
+
+class TestUnion(unittest.TestCase):
+    def test_load(self):
+        r = Record.load({'id': 'abc', 'owner': {'city': 'X', 'state': 'Y'}, 'when': 0,
+                         'extra': {'a': [1, 2]}})
+        self.assertEqual(r.id, 'abc')
+        self.assertIsInstance(r.owner, Address)
+        self.assertEqual(r.when, datetime(1970, 1, 1))
+        self.assertEqual(r.extra, {'a': [1, 2]})
+        r = Record.load({'id': 7, 'owner': ['a', 'b'], 'when': 'soon', 'extra': 3})
+        self.assertEqual(r.id, 7)
+        self.assertEqual(r.owner, ['a', 'b'])
+        self.assertEqual(r.when, 'soon')
+        self.assertEqual(r.extra, 3)
+
+    def test_any_copied(self):
+        json_data = {'extra': {'a': [1, {'b': 2}]}}
+        r = Record.load(json_data)
+        r.extra['a'][1]['b'] = 3
+        r.extra['c'] = 4
+        self.assertEqual(json_data, {'extra': {'a': [1, {'b': 2}]}})
+
+    def test_load_wrong_type(self):
+        with self.assertRaises(TypeError):
+            Record.load({'id': [1]})
+        with self.assertRaises(TypeError):
+            Record.load({'owner': 'abc'})
+        with self.assertRaises(TypeError):
+            Record.load({'id': True})
+        with self.assertRaises(TypeError):
+            Record(id=True).dump()
+
+    def test_overlapping_choices(self):
+        for spec in (Union[Address, Contact], Union[Address, MapOf[str]], Union[Any, int], Union[int, int]):
+            with self.assertRaises(TypeError):
+                @jsonified
+                class Bad:
+                    x = Field(spec)
+
+        @jsonified
+        class Number:
+            x = Field(Union[int, float])
+            y = Field(Union[bool, int])
+
+        n = Number.load({'x': 1.5, 'y': True})
+        self.assertEqual((n.x, n.y), (1.5, True))
+        n = Number.load({'x': 2, 'y': 3})
+        self.assertEqual((type(n.x), n.y), (int, 3))
+
+    def test_dump(self):
+        r = Record(id=MyStr('x'), owner=Address(city='X', state='Y'), when=datetime(1970, 1, 2),
+                   extra=[Contact(kind='a', data='b'), datetime(2020, 1, 1), (1, 'c')])
+        self.assertEqual(r.dump(), {'id': 'x',
+                                    'owner': {'street': '', 'city': 'X', 'state': 'Y'},
+                                    'when': int(datetime(1970, 1, 2).timestamp()),
+                                    'extra': [{'kind': 'a', 'data': 'b'}, '2020-01-01T00:00:00Z', [1, 'c']]})
+        with self.assertRaises(TypeError):
+            Record(id=1.5).dump()
+        with self.assertRaises(TypeError):
+            Record(extra=object()).dump()
+
+    def test_mutable_defaults(self):
+        @jsonified
+        class A:
+            extra = Field(Any, default=[])
+            ids = Field(Union[int, ListOf[int]], default=[1])
+
+        a = A()
+        a.extra.append(1)
+        a.ids.append(2)
+        for other in (A(), A.load({})):
+            self.assertEqual((other.extra, other.ids), ([], [1]))
+
+    def test_clone_and_fingerprint(self):
+        r = Record(id=1, owner=['a'], extra={'k': [Contact(kind='a', data='b')]})
+        c = r.clone()
+        self.assertIsNot(c.owner, r.owner)
+        self.assertIsNot(c.extra['k'][0], r.extra['k'][0])
+        self.assertEqual(c.fingerprint(), r.fingerprint())
+        self.assertNotEqual(Record(id=1).fingerprint(), Record(id='1').fingerprint())
+        self.assertEqual(canonical(Record(extra=[1.0, -0.0])), canonical(Record(extra=[1, 0])))
+        at = datetime(2002, 12, 25, 6, 0, tzinfo=timezone.utc)
+        self.assertEqual(Record(extra={'at': at}).fingerprint(),
+                         Record(extra={'at': at.astimezone(timezone(timedelta(hours=-6)))}).fingerprint())
+
+
+@jsonified
+class Animal:
+    name = Field(str)
+
+
+@jsonified
+class Dog(Animal):
+    breed = Field(str)
+
+
+@jsonified
+class Zoo:
+    animals = Field(ListOf[Animal])
+    star = Field(Animal)
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {'name': 'A', 'last-name': 'X', 'age': 1, 'hobbies': ['a'], 'birthday': 0},
+            {'name': 'B', 'last-name': 'Y', 'address': {'city': 'C', 'state': 'D'}},
+            {'name': 'C', 'last-name': 'Z', 'age': 3, 'is-admin': True, 'hobbies': ['b', 'c'],
+             'contacts': {'home': {'kind': 'phone', 'data': '1'}, 'work': {'kind': 'fax', 'data': '2'}}},
+            {'name': 'D', 'last-name': 'W', 'contacts': {'home': {'kind': 'email', 'data': '3'}}},
+        ]
+
+    def test_load_many(self):
+        people = Person.load_many(self.records)
+        self.assertEqual([p.dump() for p in people], [Person.load(r).dump() for r in self.records])
+        self.assertEqual(people[1].age, 33)
+        self.assertEqual(people[2].hobbies, ['b', 'c'])
+        self.assertEqual(people[2].contacts['work'].kind, 'fax')
+        self.assertEqual(people[3].contacts['home'].data, '3')
+
+    def test_dump_many(self):
+        people = [Person.load(r) for r in self.records]
+        self.assertEqual(Person.dump_many(people), [p.dump() for p in people])
+
+    def test_dump_subclasses(self):
+        z = Zoo(animals=[Animal(name='cat'), Dog(name='rex', breed='lab')], star=Dog(name='max', breed='pug'))
+        self.assertEqual(z.dump()['animals'], [{'name': 'cat'}, {'name': 'rex', 'breed': 'lab'}])
+        self.assertEqual(Zoo.dump_many([z]), [z.dump()])
+        self.assertEqual(Animal.dump_many(z.animals), [{'name': 'cat'}, {'name': 'rex', 'breed': 'lab'}])
+
+    def test_load_errors(self):
+        records = self.records[:3] + [{'name': 'D'}, {'name': 'E', 'last-name': 'W', 'age': 'old'}]
+        with self.assertRaises(ValueError) as context:
+            Person.load_many(records)
+        self.assertIn('Item 3', str(context.exception))
+        records.append([1])
+        result = Person.load_many(records, errors='collect')
+        self.assertEqual([p.name for p in result.items], ['A', 'B', 'C'])
+        self.assertEqual([e.index for e in result.errors], [3, 4, 5])
+        self.assertIsInstance(result.errors[1].error, ValueError)
+        self.assertIsInstance(result.errors[2].error, TypeError)
+
+    def test_first_bad_record_raised(self):
+        @jsonified
+        class Pair:
+            n = Field(int)
+            f = Field(float)
+
+        records = [{'n': 1, 'f': 'x'}, {'n': 'y', 'f': 1.0}]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for kwargs in ({}, {'executor': executor, 'chunk_size': 1}):
+                with self.assertRaises(ValueError) as context:
+                    Pair.load_many(records, **kwargs)
+                self.assertIn('Item 0', str(context.exception))
+
+    def test_dump_errors(self):
+        people = [Person(name='A', age=1), Person(name='B', age='x'), Address(city='C')]
+        result = Person.dump_many(people, errors='collect')
+        self.assertEqual(result.items, [Person(name='A', age=1).dump()])
+        self.assertEqual([e.index for e in result.errors], [1, 2])
+        with self.assertRaises(ValueError):
+            Person.dump_many(people, errors='ignore')
+
+
+class TestConcurrency(unittest.TestCase):
+    def test_load_many_executor(self):
+        records = [{'name': f'n{i}', 'last-name': 'x', 'age': i + 1} for i in range(100)]
+        records[57] = {'name': 'bad', 'last-name': 'x', 'age': 'old'}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = Person.load_many(records, errors='collect', executor=executor, chunk_size=10)
+            self.assertEqual(len(result.items), 99)
+            self.assertEqual([e.index for e in result.errors], [57])
+            with self.assertRaises(ValueError) as context:
+                Person.load_many(records, executor=executor, chunk_size=10)
+            self.assertIn('Item 57', str(context.exception))
+            del records[57]
+            people = Person.load_many(records, executor=executor, chunk_size=7)
+            self.assertEqual([p.age for p in people], [p.age for p in Person.load_many(records)])
+            self.assertEqual(Person.dump_many(people, executor=executor, chunk_size=7), Person.dump_many(people))
+
+    def test_concurrent_first_reads(self):
+        json_data = {'contacts': {str(i): {'kind': 'k', 'data': str(i)} for i in range(50)}}
+        for _ in range(20):
+            d = Directory.load(json_data)
+            p = Person(name='A')
+            barrier = threading.Barrier(4)
+            seen = []
+
+            def read():
+                barrier.wait()
+                seen.append((p.hobbies, [d.contacts[k] for k in d.contacts]))
+
+            threads = [threading.Thread(target=read) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            for hobbies, contacts in seen:
+                self.assertIs(hobbies, p.hobbies)
+                self.assertTrue(all(c is d.contacts[k] for c, k in zip(contacts, d.contacts)))
+
+    def test_concurrent_jsonify(self):
+        j = Jsonier()
+        barrier = threading.Barrier(8)
+        classes = []
+
+        def define(i):
+            barrier.wait()
+            register_handlers(j)
+            cls = j(type(f'C{i}', (), {'x': Field(int), 'y': Field(ListOf[Contact])}))
+            classes.append(cls)
+
+        threads = [threading.Thread(target=define, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(classes), 8)
+        for cls in classes:
+            self.assertEqual(cls.load({'x': 1, 'y': [{'kind': 'a', 'data': 'b'}]}).y[0].kind, 'a')
+
+
 if __name__ == '__main__':
     unittest.main()
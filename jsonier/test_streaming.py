@@ -0,0 +1,133 @@
+import gzip
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from jsonier import *
+from jsonier.util import compression
+from jsonier.util.compression import open_lines, open_writer, compression_from_magic
+
+
+@jsonified
+class User:
+    name = Field(str, required=True)
+    last_name = Field(str, name='last-name')
+    age = Field(int, default=18)
+    tags = Field(ListOf[str])
+
+
+LINES = '''{"name": "Ann", "last-name": "Lee", "age": 31, "tags": ["a"]}
+{"name": "Bob", "last-name": "Ross", "age": 52}
+
+{"name": "Cid", "age": 17, "tags": ["b", "c"]}
+'''
+
+
+class TestScan(unittest.TestCase):
+    def test_all(self):
+        users = list(User.scan(io.StringIO(LINES)))
+        self.assertEqual([u.name for u in users], ['Ann', 'Bob', 'Cid'])
+        self.assertEqual(users[1].last_name, 'Ross')
+
+    def test_where(self):
+        users = list(User.scan(LINES.splitlines(), where=lambda r: r.get('last_name') == 'Ross'))
+        self.assertEqual([u.name for u in users], ['Bob'])
+
+    def test_where_skips_conversion(self):
+        lines = ['{"name": "Ann", "age": "not a number"}', '{"name": "Bob", "age": 3}']
+        users = list(User.scan(lines, where=lambda r: r['name'] != 'Ann'))
+        self.assertEqual(users[0].age, 3)
+        with self.assertRaises(ValueError):
+            list(User.scan(lines))
+
+    def test_projection(self):
+        users = list(User.scan(io.StringIO(LINES), where=lambda r: r['age'] > 18, fields=['name']))
+        self.assertEqual([u.name for u in users], ['Ann', 'Bob'])
+        self.assertEqual(users[0].age, 18)
+        self.assertIsNone(users[0].tags)
+        with self.assertRaises(ValueError):
+            list(User.scan(io.StringIO(LINES), fields=['nickname']))
+
+    def test_path(self):
+        fd, path = tempfile.mkstemp(suffix='.ndjson')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(LINES)
+            self.assertEqual(len(list(User.scan(path))), 3)
+        finally:
+            os.remove(path)
+
+
+class TestCompressed(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.users = [User(name=f'u{i}', age=i + 1, tags=['x'] * (i % 3)) for i in range(1000)]
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_round_trip(self):
+        for ext in ('.ndjson', '.ndjson.gz', '.ndjson.bz2', '.ndjson.xz'):
+            path = os.path.join(self.dir.name, 'users' + ext)
+            self.assertEqual(User.dump_lines(self.users, path), 1000)
+            users = list(User.scan(path))
+            self.assertEqual([u.dump() for u in users], [u.dump() for u in self.users])
+
+    def test_magic(self):
+        path = os.path.join(self.dir.name, 'users.dat')
+        User.dump_lines(self.users, path, compression='xz')
+        with open(path, 'rb') as f:
+            self.assertEqual(compression_from_magic(f.read(8)), 'xz')
+        self.assertEqual(len(list(User.scan(path))), 1000)
+        with open(path, 'rb') as f:
+            self.assertEqual(len(list(User.scan(f, where=lambda r: r['age'] <= 10))), 10)
+
+    def test_small_chunks(self):
+        data = gzip.compress(LINES.encode() * 100)
+        with mock.patch.object(compression, 'CHUNK_SIZE', 7):
+            with open_lines(io.BytesIO(data)) as lines:
+                self.assertEqual(len([line for line in lines if line]), 300)
+
+    def test_file_objects(self):
+        data = (LINES * 10).encode()
+        for wrap in (io.BytesIO, lambda d: io.BufferedReader(io.BytesIO(d))):
+            self.assertEqual(len(list(User.scan(wrap(gzip.compress(data))))), 30)
+            self.assertEqual(len(list(User.scan(wrap(data)))), 30)
+        self.assertEqual(len(list(User.scan(io.StringIO(LINES)))), 3)
+
+    def test_early_exit(self):
+        path = os.path.join(self.dir.name, 'users.gz')
+        User.dump_lines(self.users * 50, path)
+        for u in User.scan(path):
+            break
+        self.assertEqual(u.name, 'u0')
+
+    def test_early_exit_stops_reader_first(self):
+        late_reads = []
+
+        class CheckedGzipFile(gzip.GzipFile):
+            def read(self, size=-1):
+                if self.closed:
+                    late_reads.append(size)
+                return super().read(size)
+
+        data = gzip.compress(LINES.encode() * 1000)
+        openers = {'gzip': lambda raw, mode: CheckedGzipFile(fileobj=raw, mode=mode)}
+        with mock.patch.dict(compression._OPENERS, openers), mock.patch.object(compression, 'CHUNK_SIZE', 16):
+            for _ in range(20):
+                scan = User.scan(io.BytesIO(data))
+                next(scan)
+                scan.close()
+        self.assertEqual(late_reads, [])
+
+    def test_writer_file_object(self):
+        buffer = io.BytesIO()
+        with open_writer(buffer, compression='gzip') as w:
+            w.write(b'{"name": "Ann"}\n')
+        self.assertEqual(gzip.decompress(buffer.getvalue()), b'{"name": "Ann"}\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
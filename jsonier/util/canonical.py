@@ -0,0 +1,45 @@
+"""
+Helpers for the canonical byte encoding used to fingerprint objects.
+The encoding is JSON-like, with sorted keys and no whitespace. Equal content always gives equal bytes,
+but the output is not meant to be parsed back.
+"""
+import json
+import math
+from datetime import datetime, timedelta, timezone
+from json.encoder import encode_basestring_ascii
+from typing import Callable
+
+Out = Callable[[bytes], None]  # receives the encoding piece by piece, e.g. hashlib's update()
+
+NULL = b'null'
+TRUE = b'true'
+FALSE = b'false'
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def canonical_json(x) -> bytes:
+    return json.dumps(x, sort_keys=True, separators=(',', ':'), allow_nan=True).encode('ascii')
+
+
+def canonical_str(s: str) -> bytes:
+    return encode_basestring_ascii(s).encode('ascii')
+
+
+def canonical_int(i: int) -> bytes:
+    return b'%d' % i
+
+
+def canonical_float(f: float) -> bytes:
+    # -0.0 becomes 0, and integral values are written like ints, so that 1.0 and 1 are the same
+    if math.isfinite(f) and f == int(f):
+        return b'%d' % int(f)
+    return repr(f).encode('ascii')
+
+
+def canonical_datetime(dt: datetime) -> bytes:
+    # microseconds since the epoch; naive datetimes are taken to be in UTC
+    epoch = _EPOCH if dt.tzinfo is None else _EPOCH_UTC
+    return b'%d' % ((dt - epoch) // _MICROSECOND)
@@ -0,0 +1,261 @@
+import bz2
+import gzip
+import lzma
+import os
+import queue
+import threading
+from contextlib import closing, contextmanager
+from typing import (
+    BinaryIO,
+    Iterable,
+    Iterator,
+    Optional,
+    Union
+)
+
+CHUNK_SIZE = 1 << 20  # bytes handed over between threads at once
+QUEUE_SIZE = 8  # chunks buffered between threads
+
+_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.lzma': 'xz',
+}
+_MAGIC = [
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+]
+_OPENERS = {
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+Source = Union[str, os.PathLike, BinaryIO, Iterable[Union[str, bytes]]]
+
+
+def compression_from_name(path: Union[str, os.PathLike]) -> Optional[str]:
+    """
+    :return: 'gzip', 'bz2', 'xz' or None, judging by the file extension
+    """
+    return _EXTENSIONS.get(os.path.splitext(os.fspath(path))[1].lower())
+
+
+def compression_from_magic(head: bytes) -> Optional[str]:
+    """
+    :return: 'gzip', 'bz2', 'xz' or None, judging by the first bytes of the data
+    """
+    for magic, kind in _MAGIC:
+        if head.startswith(magic):
+            return kind
+    return None
+
+
+def _put(q: queue.Queue, stop: threading.Event, item) -> bool:
+    # blocks while the queue is full, but gives up once the other side is gone
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _chunks_in_background(f: BinaryIO, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Reads (and decompresses) f in a separate thread, while the caller processes earlier chunks.
+    """
+    if chunk_size is None:
+        chunk_size = CHUNK_SIZE
+    q = queue.Queue(maxsize=QUEUE_SIZE)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            while True:
+                chunk = f.read(chunk_size)
+                if not _put(q, stop, chunk) or not chunk:
+                    return
+        except BaseException as e:
+            _put(q, stop, e)
+
+    thread = threading.Thread(target=produce, name='jsonier-reader', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = q.get()
+            if isinstance(item, BaseException):
+                raise item
+            if not item:
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _chunks(f: BinaryIO, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+    if chunk_size is None:
+        chunk_size = CHUNK_SIZE
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _split_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    tail = b''
+    for chunk in chunks:
+        lines = (tail + chunk).split(b'\n')
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+@contextmanager
+def _open_lines(f: BinaryIO, background: bool):
+    # the chunk reader is closed (and its thread stopped) on exit, before the caller closes f
+    chunks = _chunks_in_background(f) if background else _chunks(f)
+    with closing(chunks):
+        yield _split_lines(chunks)
+
+
+@contextmanager
+def open_lines(source: Source, background: bool = True):
+    """
+    Opens a source of newline-delimited records.
+    Files compressed with gzip, bz2 or xz are recognized by their extension or first bytes
+    and decompressed, in a background thread unless `background` is False.
+    :param source: file name, file object or any iterable of lines (used as is).
+        The first bytes of file objects are checked if they can be peeked at or seeked back to.
+    :return: context manager yielding an iterable of lines
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as raw:
+            kind = compression_from_name(source) or compression_from_magic(raw.peek(8))
+            if kind is None:
+                yield raw
+                return
+            with _OPENERS[kind](raw, 'rb') as f, _open_lines(f, background) as lines:
+                yield lines
+    else:
+        head = _head(source)
+        kind = compression_from_magic(head) if isinstance(head, bytes) else None
+        if kind is None:
+            yield source
+            return
+        with _OPENERS[kind](source, 'rb') as f, _open_lines(f, background) as lines:
+            yield lines
+
+
+def _head(source) -> Optional[Union[str, bytes]]:
+    # the first bytes of a file object, without consuming them; None if they cannot be put back
+    if hasattr(source, 'peek'):
+        return source.peek(8)
+    if hasattr(source, 'read') and hasattr(source, 'seekable') and source.seekable():
+        pos = source.tell()
+        head = source.read(8)
+        source.seek(pos)
+        return head
+    return None
+
+
+class _BackgroundWriter:
+    """
+    File-like object that collects written data into chunks and writes (and compresses)
+    them into f in a separate thread.
+    """
+
+    def __init__(self, f: BinaryIO, chunk_size: Optional[int] = None):
+        self._f = f
+        self._chunk_size = CHUNK_SIZE if chunk_size is None else chunk_size
+        self._buffer = []
+        self._buffered = 0
+        self._queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._stop = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._consume, name='jsonier-writer', daemon=True)
+        self._thread.start()
+
+    def _consume(self):
+        try:
+            while True:
+                chunk = self._queue.get()
+                if chunk is None:
+                    return
+                self._f.write(chunk)
+        except BaseException as e:
+            self._error = e
+            self._stop.set()
+
+    def _flush(self):
+        if self._buffer:
+            chunk = b''.join(self._buffer)
+            self._buffer = []
+            self._buffered = 0
+            if not _put(self._queue, self._stop, chunk):
+                raise self._error
+
+    def write(self, data: bytes) -> int:
+        self._buffer.append(data)
+        self._buffered += len(data)
+        if self._buffered >= self._chunk_size:
+            self._flush()
+        return len(data)
+
+    def close(self):
+        try:
+            self._flush()
+        finally:
+            _put(self._queue, self._stop, None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+@contextmanager
+def open_writer(target: Union[str, os.PathLike, BinaryIO],
+                compression: Optional[str] = 'auto',
+                background: bool = True):
+    """
+    Opens a binary destination for newline-delimited records.
+    :param target: file name or binary file object
+    :param compression: 'gzip', 'bz2', 'xz', None, or 'auto' to choose by the file extension
+    :param background: compress in a separate thread
+    :return: context manager yielding an object with a write(bytes) method
+    """
+    if compression == 'auto':
+        is_path = isinstance(target, (str, os.PathLike))
+        compression = compression_from_name(target) if is_path else None
+    if compression is not None and compression not in _OPENERS:
+        raise ValueError(f'Unknown compression: {compression}')
+
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, 'wb') as raw:
+            with _open_compressed_writer(raw, compression, background) as w:
+                yield w
+    else:
+        with _open_compressed_writer(target, compression, background) as w:
+            yield w
+
+
+@contextmanager
+def _open_compressed_writer(raw: BinaryIO, compression: Optional[str], background: bool):
+    if compression is None:
+        yield raw
+        return
+    with _OPENERS[compression](raw, 'wb') as f:
+        if not background:
+            yield f
+            return
+        writer = _BackgroundWriter(f)
+        try:
+            yield writer
+        finally:
+            writer.close()
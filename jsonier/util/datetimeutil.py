@@ -41,3 +41,68 @@ def auto_to_datetime(t: Union[int, float, str, datetime]) -> datetime:
         return str_to_datetime(t)
     else:
         raise TypeError(f'Cannot convert {type(t)} to datetime')
+
+
+# Bulk conversions of whole lists. They map the underlying datetime methods directly
+# to avoid a Python-level call per item, and raise TypeError on nulls.
+
+def ints_to_datetimes(ts: list) -> list:
+    return list(map(datetime.utcfromtimestamp, ts))
+
+
+def datetimes_to_ints(dts: list) -> list:
+    return list(map(int, map(datetime.timestamp, dts)))
+
+
+def floats_to_datetimes(ts: list) -> list:
+    return list(map(datetime.utcfromtimestamp, ts))
+
+
+def datetimes_to_floats(dts: list) -> list:
+    return list(map(datetime.timestamp, dts))
+
+
+def strs_to_datetimes(ts: list) -> list:
+    return list(map(str_to_datetime, ts))
+
+
+def datetimes_to_strs(dts: list) -> list:
+    return list(map(datetime_to_str, dts))
+
+
+def autos_to_datetimes(ts: list) -> list:
+    return list(map(auto_to_datetime, ts))
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('numpy is required to store timestamps in arrays') from None
+    return numpy
+
+
+def ints_to_datetime64(ts: list):
+    """
+    Converts a list of UNIX timestamps in seconds to a numpy datetime64[s] array (UTC).
+    """
+    np = _numpy()
+    return np.asarray(ts, dtype=np.int64).astype('datetime64[s]')
+
+
+def datetime64_to_ints(arr) -> list:
+    np = _numpy()
+    return np.asarray(arr).astype('datetime64[s]').astype(np.int64).tolist()
+
+
+def floats_to_datetime64(ts: list):
+    """
+    Converts a list of UNIX timestamps in fractional seconds to a numpy datetime64[us] array (UTC).
+    """
+    np = _numpy()
+    return np.rint(np.asarray(ts, dtype=np.float64) * 1e6).astype(np.int64).astype('datetime64[us]')
+
+
+def datetime64_to_floats(arr) -> list:
+    np = _numpy()
+    return (np.asarray(arr).astype('datetime64[us]').astype(np.int64) / 1e6).tolist()
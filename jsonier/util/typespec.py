@@ -55,6 +55,9 @@ class TypeSpec:
     ListOf = 'list'
     MapOf = 'map'
     Timestamp = 'timestamp'
+    OneOf = 'oneof'
+    Union = 'union'
+    Any = 'any'
 
     def __init__(self, head: str, arg=None):
         self._tuple = (head, arg)